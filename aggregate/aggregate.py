@@ -134,47 +134,44 @@ wg_heater_length = 500
 student_laser_in_y = 250e3
 laser_pad_distance = 400e3
 
-def find_port_sin_cell_and_position(cell, log_func=None, visited_cells=None):
+port_cell_name = "port_SiN"  # cells with this in their name are the laser input port of a design
+
+def find_port_sin_cell_and_position(cell, log_func=None):
     """
     Find the first port_SiN instance in a cell and return both the cell and its y-coordinate.
-    Searches recursively through all levels of the cell hierarchy.
+    Direct instances are checked first; deeper levels are then searched in a single pass of
+    KLayout's recursive instance iterator.
     
     Args:
         cell: The cell to search for port_SiN instances
         log_func: Optional logging function
-        visited_cells: Set to track visited cells and prevent infinite recursion
         
     Returns:
-        tuple: (port_cell, y_position) or (None, None) if not found
+        tuple: (port_cell, y_position) or (None, None) if not found;
+            y_position is the center of the port cell in the coordinates of cell
     """
-    if visited_cells is None:
-        visited_cells = set()
-    
-    # Prevent infinite recursion by tracking visited cells
-    if cell.cell_index() in visited_cells:
-        return None, None
-    visited_cells.add(cell.cell_index())
-    
     if log_func:
         log_func(f"Searching for port_SiN instances in cell: {cell.name}")
     
-    # Search through all direct cell instances
+    # Direct instances first, so a port_SiN placed in the cell wins over a nested one
     for inst in cell.each_inst():
-        # Check if the cell name contains "port_SiN"
-        if "port_SiN" in inst.cell.name:
-            # Get the transformed bounding box to find the y position
-            bbox = inst.bbox()
-            y_position = bbox.center().y
+        if port_cell_name in inst.cell.name:
+            y_position = inst.bbox().center().y
             if log_func:
                 log_func(f"Found port_SiN instance '{inst.cell.name}' at y={y_position}")
             return inst.cell, y_position
     
-    # If no port_SiN found in direct instances, recursively search in sub-cells
-    for inst in cell.each_inst():
-        # Recursively search in the sub-cell
-        port_cell, y_position = find_port_sin_cell_and_position(inst.cell, log_func, visited_cells)
-        if port_cell is not None:
-            return port_cell, y_position
+    # Then the deeper levels: only deliver instances of cells whose name contains "port_SiN"
+    it = cell.begin_instances_rec()
+    it.targets = f"*{port_cell_name}*"
+    if not it.at_end():
+        port_cell = it.inst_cell()
+        # Transformation of the instance into the searched cell
+        trans = it.trans() * it.inst_trans()
+        y_position = trans.trans(port_cell.bbox().center()).y
+        if log_func:
+            log_func(f"Found port_SiN instance '{port_cell.name}' at y={y_position}")
+        return port_cell, y_position
     
     if log_func:
         log_func(f"No port_SiN instances found in cell: {cell.name}")
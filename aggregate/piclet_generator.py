@@ -29,6 +29,9 @@ FEATURES:
 
 6. **Verification System**: Runs layout verification during submission loading
    to filter out problematic designs with disconnected pins or other critical errors.
+   Each file is checked with a single verbose layout_check run, whose output gives
+   the error details; the files are checked in parallel worker processes. Empty or
+   near-empty files (tiny bounding box, few shapes) are skipped before layout_check.
 
 7. **Robust Top Cell Selection**: Uses SiEPIC-Tools utility functions for
    reliable identification of the main design cell in hierarchical layouts.
@@ -76,19 +79,24 @@ TECHNICAL IMPLEMENTATION:
 
             **GitHub Username Extraction:**
             - Multi-layered approach for maximum accuracy:
+              0. **Author manifest**: `submissions/authors.json` ({filename: username}) and usernames
+                 resolved on previous runs (`submissions/authors.auto.json`, expiring like the
+                 GitHub API cache) skip all lookups
               1. **GitHub noreply emails**: Direct extraction from format `ID+username@users.noreply.github.com`
               2. **Repository fork matching**: Queries GitHub API for repository forks and matches author names
-              3. **GitHub API search**: Searches GitHub API by email address for public accounts
+              3. **GitHub API search**: Searches GitHub commits by author email (author.login),
+                 with one lookup per unique author email, run concurrently
               4. **Email parsing fallback**: Extracts username from email with special mappings
-            - Caches API responses to avoid rate limiting
-            - Handles GitHub API rate limits with automatic retry
+            - Caches API responses on disk (aggregate/.cache/github_api.json, 7 day expiry)
+              to avoid rate limiting and repeated lookups on re-runs
+            - Handles GitHub API rate limits with automatic retry (waits until X-RateLimit-Reset)
+            - Authenticates with GITHUB_TOKEN from the environment, if set (5000 vs 60 requests/hour)
             - Handles duplicate usernames by adding numeric suffixes (1, 2, 3...)
             - Falls back to 'unknown' if all methods fail
 
 **Dynamic Port Detection:**
-- Recursively searches cell hierarchy for port_SiN instances
+- Searches cell hierarchy for port_SiN instances (direct instances first, then KLayout recursive instance iterator)
 - Places optical pins directly in port cells for accurate connections
-- Uses visited_cells set to prevent infinite recursion
 - Calculates absolute positions including all transformations
 
 **FaML Copy Generation:**
@@ -126,6 +134,7 @@ TECHNICAL IMPLEMENTATION:
 CONFIGURATION:
 --------------
 - process_num_submissions: Number of submissions to process (default: 4)
+- piclet_workers: Number of PIClets generated in parallel (default: number of CPUs)
 - die_width: Chip width in nanometers (default: 2753330)
 - laser_start_y: Vertical position of the first laser (default: 300e3 = 300 µm above center)
 - laser_circuit_spacing: Vertical spacing between submissions (default: 1100e3 = 1100 µm)
@@ -139,7 +148,7 @@ DEPENDENCIES:
 - KLayout Python API: Layout manipulation and cell operations
 - Git: Commit history analysis and repository information
 - GitHub API: Username lookup and repository fork detection
-- requests: HTTP client for GitHub API calls
+- requests: HTTP client for GitHub API calls (imported on first API call)
 - siepic_ebeam_pdk: Photonic component library
 
 USAGE:
@@ -148,11 +157,12 @@ python piclet_generator.py
 
 The script automatically:
 1. Loads all GDS/OAS files from submissions directory
-2. Runs verification checks and filters out problematic designs
+2. Runs verification checks (in parallel) and filters out problematic designs
 3. Extracts GitHub usernames using multiple methods (API, forks, emails)
 4. Processes submissions in pairs to reduce chip count
 5. Creates copies and explodes regular arrays during PIClet generation
-6. Generates PIClets with combined designs and exports layouts
+6. Generates PIClets with combined designs and exports layouts, in parallel
+   worker processes (piclet_workers)
 
 EXAMPLE OUTPUT:
 ---------------
@@ -183,16 +193,23 @@ Based on: dream_piclet_3x3.py (simplified architecture)
 '''
 
 import os
+import re
+import io
+import json
+import contextlib
 import pya
+import shutil
 import subprocess
-import requests
 import time
-from SiEPIC.utils.layout import new_layout, floorplan, make_pin
-from SiEPIC.utils import klive
-from SiEPIC.verification import layout_check
+import threading
+import weakref
+import functools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from SiEPIC.utils.layout import new_layout, floorplan, make_pin, y_splitter_tree, add_time_stamp
+from SiEPIC.utils import klive, layout_pgtext, top_cell_with_most_subcells_or_shapes
 from SiEPIC.scripts import (
     zoom_out,
-    export_layout,
     connect_pins_with_waveguide,
     connect_cell,
 )
@@ -216,10 +233,86 @@ laser_start_y = 300e3  # Vertical position of the first laser (y=0 is center)
 laser_circuit_spacing = 1100e3  # 1500 µm spacing between submissions
 submission_GC_dy = 500e3  # Vertical offset for submission grating couplers
 
+# Number of worker processes, for verifying submissions and generating PIClets in parallel
+piclet_workers = os.cpu_count() or 1
+
+# OASIS compression level (0-10) of the PIClets; 10 as in export_layout, for the tapeout files.
+# Low levels write faster, for trial runs. Each PIClet is written once, to piclets_path, and
+# the file is copied to tapeout_path, so this is also the level of the tapeout files.
+piclet_oasis_compression_level = 10
+
+# Folder collecting the PIClets for the tapeout
+tapeout_path = "/Users/lukasc/Documents/GitHub/SiEPIC_Shuksan_ANT_SiN_2025_08/submissions/3x3"
+
+# Submissions with fewer shapes than this (all layers, flattened) are skipped as empty,
+# without running the full verification
+min_submission_shapes = 10
+
+# Show each PIClet (KLive or the KLayout application) after exporting it; off for batch runs,
+# set the PICLET_SHOW environment variable to enable
+show_piclets = bool(os.environ.get('PICLET_SHOW'))
+
+# Print debug messages (the PIClet construction steps and the transformations
+# in move_instance_up_hierarchy); warnings and errors are always printed
+debug = False
+
 global count
 count= 0
 
 
+@functools.lru_cache(maxsize=8)
+def waveguide_spec(wavelength):
+    """
+    Get the waveguide type and bend radius for a wavelength.
+    
+    Args:
+        wavelength: The wavelength in nm
+        
+    Returns:
+        tuple: (wg_type, radius), radius in microns
+    """
+    wg_type = f"SiN Strip TE {wavelength} nm, w=800 nm"
+    # Get bend radius from waveguide specification
+    try:
+        radius = pdk.tech.waveguides[wg_type].radius
+    except Exception:
+        radius = 60  # fallback default in microns if not found
+    return wg_type, radius
+
+
+# Library cells already created in each layout, see library_cell()
+_library_cells = weakref.WeakKeyDictionary()
+
+
+def library_cell(ly, cell_name, library, params=None):
+    """
+    Get a library cell (or PCell variant) in a layout, creating it only the first time it is used in that layout.
+    Fixed cells are loaded with create_cell2, which reports why a cell is not available.
+    
+    Args:
+        ly: The layout
+        cell_name: Name of the cell in the library
+        library: Name of the library
+        params: Optional dict of PCell parameters
+        
+    Returns:
+        pya.Cell: The cell, or None if it cannot be created
+    """
+    key = (cell_name, library, tuple(sorted(params.items())) if params else None)
+    cells = _library_cells.setdefault(ly, {})
+    cell_index = cells.get(key)
+    if cell_index is not None and ly.is_valid_cell_index(cell_index):
+        return ly.cell(cell_index)
+    
+    if params:
+        cell = ly.create_cell(cell_name, library, params)
+    else:
+        cell = create_cell2(ly, cell_name, library)
+    if cell:
+        cells[key] = cell.cell_index()
+    return cell
+
+
 def create_laser_and_heater(cell, ly, wavelength=1310, laser_x=-500e3, center_y=0, laser_align='left', left_edge=0):
     """
     Create laser and heater components with waveguide connection.
@@ -235,15 +328,11 @@ def create_laser_and_heater(cell, ly, wavelength=1310, laser_x=-500e3, center_y=
     Returns:
         tuple: (inst_laser, inst_heater, wg_type, radius)
     """
-    wg_type = f"SiN Strip TE {wavelength} nm, w=800 nm"
-    # Get bend radius from waveguide specification
-    try:
-        radius = pdk.tech.waveguides[wg_type].radius
-    except Exception:
-        radius = 60  # fallback default in microns if not found
+    wg_type, radius = waveguide_spec(wavelength)
     
     # Load the laser cell
-    laser = ly.create_cell(
+    laser = library_cell(
+        ly,
         f"ebeam_dream_Laser_SiN_{wavelength}_Bond_BB",
         "EBeam-Dream",
     )
@@ -257,11 +346,11 @@ def create_laser_and_heater(cell, ly, wavelength=1310, laser_x=-500e3, center_y=
     inst_laser = cell.insert(pya.CellInstArray(laser.cell_index(), t))
 
     # Add wg_heater after the laser
-    cell_heater = ly.create_cell('wg_heater', 'EBeam-SiN', 
-                                  {'length': 500,
-                                   'mh_width': 5,
-                                   'waveguide_type': wg_type,
-                                   })
+    cell_heater = library_cell(ly, 'wg_heater', 'EBeam-SiN', 
+                               {'length': 500,
+                                'mh_width': 5,
+                                'waveguide_type': wg_type,
+                                })
     inst_heater = connect_cell(inst_laser, 'opt1', cell_heater, 'opt1')
     # Move heater 100µm to the right
     inst_heater.transform(pya.Trans(100e3, 0))
@@ -295,64 +384,165 @@ def create_bond_pads_and_routing(cell, ly, inst_laser, inst_heater, laser_x=-500
     metal_width = 20e3
     
     # Add bond pads above the laser
-    cell_pad = create_cell2(ly, 'ebeam_BondPad', 'EBeam-SiN')
+    cell_pad = library_cell(ly, 'ebeam_BondPad', 'EBeam-SiN')
+    pad_index = cell_pad.cell_index()
+    pad_bbox = cell_pad.bbox()
+    laser_bbox = inst_laser.bbox()
+    shapes_m2 = cell.shapes(ly.layer(ly.TECHNOLOGY['M2_router']))
 
-    bondpads_x_offset = inst_laser.bbox().left + cell_pad.bbox().width()/2 + ground_wire_width + trench_bondpad_offset
-    bondpads_y = inst_laser.bbox().top + laser_pad_distance + cell_pad.bbox().height()/2
+    bondpads_x_offset = laser_bbox.left + pad_bbox.width()/2 + ground_wire_width + trench_bondpad_offset
+    bondpads_y = laser_bbox.top + laser_pad_distance + pad_bbox.height()/2
 
     # Bond pad for the laser top contact, and route to the left edge
     t = pya.Trans(inst_laser.trans.disp.x + x_laser_top_contact, 
                   bondpads_y)
-    inst_padL1 = cell.insert(pya.CellInstArray(cell_pad.cell_index(), t))
+    inst_padL1 = cell.insert(pya.CellInstArray(pad_index, t))
     t = pya.Trans(bondpads_x_offset, 
                   bondpads_y)
-    inst_padL2 = cell.insert(pya.CellInstArray(cell_pad.cell_index(), t))
+    inst_padL2 = cell.insert(pya.CellInstArray(pad_index, t))
     # Metal routing to connect the two bond pads
     pts = [
         inst_padL1.find_pin('m_pin_left').center,
         inst_padL2.find_pin('m_pin_right').center,
     ]
     path = pya.Path(pts, metal_width)
-    cell.shapes(ly.layer(ly.TECHNOLOGY['M2_router'])).insert(path)
+    shapes_m2.insert(path)
     
     # Bond pads for the heater    
     # Place first bond pad
     bondpads_y += pad_pitch
     t = pya.Trans(bondpads_x_offset, 
                   bondpads_y)
-    inst_pad1 = cell.insert(pya.CellInstArray(cell_pad.cell_index(), t))
+    inst_pad1 = cell.insert(pya.CellInstArray(pad_index, t))
     
     # Place second bond pad
     bondpads_y += pad_pitch
     t = pya.Trans(bondpads_x_offset, 
                   bondpads_y)
-    inst_pad2 = cell.insert(pya.CellInstArray(cell_pad.cell_index(), t))
+    inst_pad2 = cell.insert(pya.CellInstArray(pad_index, t))
     
     # Metal routing from pad1 to heater elec1
+    pad_pin = inst_pad1.find_pin('m_pin_right').center
+    heater_pin = inst_heater.find_pin('elec1').center
     pts = [
-        inst_pad1.find_pin('m_pin_right').center,
-        pya.Point(inst_heater.find_pin('elec1').center.x,
-                  inst_pad1.find_pin('m_pin_right').center.y),
-        inst_heater.find_pin('elec1').center
+        pad_pin,
+        pya.Point(heater_pin.x, pad_pin.y),
+        heater_pin
     ]
     path = pya.Path(pts, metal_width)
-    cell.shapes(ly.layer(ly.TECHNOLOGY['M2_router'])).insert(path)
+    shapes_m2.insert(path)
     
     # Metal routing from pad2 to heater elec2
+    pad_pin = inst_pad2.find_pin('m_pin_right').center
+    heater_pin = inst_heater.find_pin('elec2').center
     pts = [
-        inst_pad2.find_pin('m_pin_right').center,
-        pya.Point(inst_heater.find_pin('elec2').center.x,
-                  inst_pad2.find_pin('m_pin_right').center.y),
-        inst_heater.find_pin('elec2').center
+        pad_pin,
+        pya.Point(heater_pin.x, pad_pin.y),
+        heater_pin
     ]
     path = pya.Path(pts, metal_width)
-    cell.shapes(ly.layer(ly.TECHNOLOGY['M2_router'])).insert(path)
+    shapes_m2.insert(path)
     
     return inst_pad1, inst_pad2
 
 
+# On-disk cache for GitHub API lookups, so that re-runs don't re-query the API
+_github_cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "github_api.json")
+_github_cache_max_age = 7 * 24 * 3600  # seconds; entries older than this are looked up again
+_github_cache_lock = threading.Lock()  # usernames are resolved from several threads
+_github_lookup_workers = 8  # concurrent username lookups
+
+
+def _load_cache():
+    """
+    Load the GitHub API cache from disk, dropping expired entries.
+    
+    Returns:
+        dict: {'users': {email: {'username', 'ts'}}, 'forks': {'owner/repo': {'forks', 'ts'}}}
+    """
+    cache = {'users': {}, 'forks': {}}
+    try:
+        with open(_github_cache_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return cache
+    
+    now = time.time()
+    for key in cache:
+        for name, entry in data.get(key, {}).items():
+            if isinstance(entry, dict) and now - entry.get('ts', 0) < _github_cache_max_age:
+                cache[key][name] = entry
+    return cache
+
+
+def _save_cache():
+    """
+    Write the GitHub API cache to disk atomically (temporary file + rename).
+    """
+    try:
+        with _github_cache_lock:
+            os.makedirs(os.path.dirname(_github_cache_path), exist_ok=True)
+            tmp_path = _github_cache_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(_github_api_cache, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, _github_cache_path)
+    except OSError as e:
+        print(f"  Warning: Could not save GitHub API cache: {e}")
+
+
+# HTTP session for GitHub API calls (reused for keep-alive), created on first use
+_github_session = None
+
+
+def _get_github_session():
+    """
+    Get the HTTP session for GitHub API calls, creating it on first use.
+    
+    requests is only imported here, so runs that need no API calls (e.g. all usernames cached)
+    don't pay for it. Set GITHUB_TOKEN to raise the rate limit from 60 to 5000 requests/hour.
+    """
+    global _github_session
+    with _github_cache_lock:
+        if _github_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            session.headers.update({
+                'Accept': 'application/vnd.github+json',
+                'X-GitHub-Api-Version': '2022-11-28',
+            })
+            if os.environ.get('GITHUB_TOKEN'):
+                session.headers['Authorization'] = f"Bearer {os.environ['GITHUB_TOKEN']}"
+            # Keep-alive connection pool sized for the lookup threads, retrying transient server errors
+            session.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=_github_lookup_workers,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+            ))
+            _github_session = session
+        return _github_session
+
+
+def _wait_for_rate_limit(response):
+    """
+    Sleep until the GitHub API rate limit resets.
+    
+    Uses the X-RateLimit-Reset header when the limit is exhausted, otherwise
+    Retry-After (secondary rate limits), falling back to 60 seconds.
+    """
+    if response.headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in response.headers:
+        wait = max(int(response.headers['X-RateLimit-Reset']) - time.time(), 0) + 1
+    else:
+        wait = int(response.headers.get('Retry-After', 60))
+    print(f"  GitHub API rate limited, waiting {wait:.0f} s...")
+    time.sleep(wait)
+
+
 # Cache for GitHub username lookups to avoid repeated API calls
-_github_username_cache = {}
+_github_api_cache = _load_cache()
+_github_username_cache = _github_api_cache['users']
 _github_forks_cache = None
 
 def move_instance_up_hierarchy(instance, num_levels=1):
@@ -364,7 +554,8 @@ def move_instance_up_hierarchy(instance, num_levels=1):
     applies the inverse transformation to maintain the same absolute position after the move.
     
     The function uses KLayout's each_parent_inst() method to traverse up the hierarchy
-    and accumulates transformations using matrix multiplication. This ensures that when
+    (a direct lookup per level, no scan of the whole layout) and accumulates
+    transformations using matrix multiplication. This ensures that when
     an instance is moved to a higher level in the hierarchy, its absolute position
     remains unchanged relative to the top cell.
     
@@ -405,13 +596,10 @@ def move_instance_up_hierarchy(instance, num_levels=1):
         This ensures that the absolute position remains unchanged after the hierarchy move.
     """
 
-    from SiEPIC.utils import top_cell_with_most_subcells_or_shapes
-        
     cell = instance.cell
-    layout = cell.layout()
-    top_cell = top_cell_with_most_subcells_or_shapes(layout)
     
-    print(f"Moving instance name {instance.cell.name}")
+    if debug:
+        print(f"Moving instance name {cell.name}")
     
     # Calculate accumulated transformation from parent instances
     # Store the current transformation before moving up hierarchy
@@ -421,7 +609,8 @@ def move_instance_up_hierarchy(instance, num_levels=1):
     current_inst = instance
     for level in range(num_levels+1):
         accumulated_transform *= current_inst.trans
-        print(f"Next transform: {current_inst.trans}, Accumulated transform: {accumulated_transform}")
+        if debug:
+            print(f"Next transform: {current_inst.trans}, Accumulated transform: {accumulated_transform}")
 
         parent_insts = list(current_inst.cell.each_parent_inst())
         
@@ -433,35 +622,26 @@ def move_instance_up_hierarchy(instance, num_levels=1):
                 
         # Get the parent cell:
         parent_cell = current_inst.parent_cell
-        print(f"Parent cell: {parent_cell.name}")
+        if debug:
+            print(f"Parent cell: {parent_cell.name}")
 
-        # Find the parent cell's Instance
-
-        # Iterate through all instances in the hierarchy
-        
-        iter = top_cell.begin_instances_rec()
-        iter.targets = parent_cell.name
-        while not iter.at_end():
-            print(f"Instance of {iter.inst_cell().name} in {top_cell.name}: {iter.dtrans() * iter.inst_dtrans()}")
-            print(f"Instance: {iter.current_inst_element().inst()}")
-            instance1 = iter.current_inst_element().inst()
-            iter.next()
-        '''
-        for inst_ptr in iter.each_instance():
-            # Check if the current instance refers to the target cell
-            if inst_ptr.cell().name == parent_cell.name:
-                print(f"Found instance of '{parent_cell.name}' in cell '{inst_ptr.parent_cell().name}'")
-        '''
-        current_inst = instance1
+        # Find the parent cell's Instance directly from its parent instances,
+        # instead of scanning the whole hierarchy from the top cell
+        parent_cell_insts = [parent_inst.child_inst() for parent_inst in parent_cell.each_parent_inst()]
+        if not parent_cell_insts:
+            raise ValueError(f"Cannot move up {num_levels} levels. Cell '{parent_cell.name}' is a top cell")
+        current_inst = parent_cell_insts[-1]
 
     
     # Move the instance to the target cell (the parent cell of the final parent instance)
-    instance.parent_cell = cell.layout().cell(current_inst.cell_index)
+    target_cell = cell.layout().cell(current_inst.cell_index)
+    instance.parent_cell = target_cell
 
     # Apply the accumulated transformation to maintain absolute position
     instance.trans = accumulated_transform
     
-    print(f"Moved instance {instance.cell.name} to new parent cell {instance.parent_cell.name} {cell.layout().cell(current_inst.cell_index).name}")
+    if debug:
+        print(f"Moved instance {cell.name} to new parent cell {target_cell.name}")
     
     return instance
 
@@ -481,28 +661,37 @@ def explode_regular_arrays(cell, log_func=None, visited_cells=None):
     if visited_cells is None:
         visited_cells = set()
     
-    # Prevent infinite recursion
-    cell_id = id(cell)
-    if cell_id in visited_cells:
+    # Prevent infinite recursion, and inspect cells used in several places only once.
+    # Use the cell index, since several Python wrappers can refer to the same cell.
+    cell_index = cell.cell_index()
+    if cell_index in visited_cells:
         return 0
-    visited_cells.add(cell_id)
+    visited_cells.add(cell_index)
     
     exploded_count = 0
     
     try:
-        # Check all instances in this cell
+        # Check all instances in this cell, in a single pass: collect the regular arrays
+        # and the sub-cells, and explode after the iteration since explode() changes
+        # the instance list of the cell
+        layout = cell.layout()
+        arrays = []
+        subcell_indices = {}  # ordered set
         for instance in cell.each_inst():
+            subcell_index = instance.cell_index
             if instance.is_regular_array():
-                if log_func:
-                    log_func(f"Exploding regular array: {instance.cell.name}")
-                instance.explode()
-                exploded_count += 1
+                arrays.append((instance, subcell_index))
+            subcell_indices[subcell_index] = None
         
-        # Recursively check sub-cells
-        for instance in cell.each_inst():
-            if not instance.is_regular_array():  # Only check non-array instances
-                subcell = instance.cell
-                exploded_count += explode_regular_arrays(subcell, log_func, visited_cells)
+        for instance, subcell_index in arrays:
+            if log_func:
+                log_func(f"Exploding regular array: {layout.cell_name(subcell_index)}")
+            instance.explode()
+            exploded_count += 1
+        
+        # Recursively check sub-cells (including the cells of the exploded arrays)
+        for subcell_index in subcell_indices:
+            exploded_count += explode_regular_arrays(layout.cell(subcell_index), log_func, visited_cells)
                 
     except Exception as e:
         if log_func:
@@ -544,12 +733,36 @@ def get_repository_forks():
             if parts:
                 owner, repo = parts.split('/', 1)
                 
-                # Get forks from GitHub API
+                # Use the on-disk cache if this repository was looked up recently
+                entry = _github_api_cache['forks'].get(f"{owner}/{repo}")
+                if entry is not None:
+                    _github_forks_cache = {
+                        'forks': set(entry['forks']),
+                        'owner': owner,
+                        'repo': repo
+                    }
+                    return _github_forks_cache
+                
+                # Get all forks from the GitHub API, following the pagination links (100 per page)
                 url = f"https://api.github.com/repos/{owner}/{repo}/forks"
-                response = requests.get(url, timeout=10)
+                params = {'per_page': 100, 'sort': 'newest'}
+                forks = []
+                complete = True
+                while url:
+                    response = _get_github_session().get(url, params=params, timeout=10)
+                    if response.status_code in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0':
+                        _wait_for_rate_limit(response)
+                        continue
+                    if response.status_code != 200:
+                        print(f"  Warning: GitHub API returned status {response.status_code}")
+                        complete = False
+                        break
+                    forks.extend(response.json())
+                    # The next page URL already contains the query parameters
+                    url = response.links.get('next', {}).get('url')
+                    params = None
                 
-                if response.status_code == 200:
-                    forks = response.json()
+                if forks or complete:
                     print(f"  Found {len(forks)} forks for {owner}/{repo}")
                     
                     # Create mapping of fork owner usernames
@@ -563,9 +776,14 @@ def get_repository_forks():
                         'owner': owner,
                         'repo': repo
                     }
+                    # Only keep complete fork lists for later runs
+                    if complete:
+                        _github_api_cache['forks'][f"{owner}/{repo}"] = {
+                            'forks': sorted(fork_usernames),
+                            'ts': time.time()
+                        }
+                        _save_cache()
                     return _github_forks_cache
-                else:
-                    print(f"  Warning: GitHub API returned status {response.status_code}")
         
         _github_forks_cache = {}
         return {}
@@ -576,10 +794,22 @@ def get_repository_forks():
         return {}
 
 
+def _cache_username(email, username):
+    """
+    Store a username lookup result (including a negative result) in the on-disk cache.
+    """
+    with _github_cache_lock:
+        _github_username_cache[email] = {'username': username, 'ts': time.time()}
+    _save_cache()
+
+
 def get_github_username_from_api(email):
     """
     Query GitHub API to get username from email address.
     
+    Uses the commit search API, which returns the GitHub account (author.login)
+    linked to the commit author email directly.
+    
     Args:
         email: Email address to look up
         
@@ -588,38 +818,229 @@ def get_github_username_from_api(email):
     """
     # Check cache first
     if email in _github_username_cache:
-        return _github_username_cache[email]
+        return _github_username_cache[email]['username']
     
     try:
-        # GitHub API endpoint for searching users by email
-        url = f"https://api.github.com/search/users?q={email}"
+        # GitHub API endpoint for searching commits by author email
+        url = "https://api.github.com/search/commits"
+        params = {'q': f"author-email:{email}", 'per_page': 10}
+        headers = {'Accept': 'application/vnd.github.cloak-preview+json'}
         
         # Make request with rate limiting
-        response = requests.get(url, timeout=10)
+        response = _get_github_session().get(url, params=params, headers=headers, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
-            if data.get('total_count', 0) > 0:
-                # Get the first user's login (username)
-                user = data['items'][0]
-                username = user.get('login')
-                # Cache the result
-                _github_username_cache[email] = username
-                return username
-        elif response.status_code == 403:
+            for item in data.get('items', []):
+                # The author is None if the email is not linked to an account
+                author = item.get('author') or {}
+                username = author.get('login')
+                if username:
+                    # Cache the result
+                    _cache_username(email, username)
+                    return username
+        elif response.status_code in (403, 429):
             # Rate limited - wait and try again
-            print(f"  GitHub API rate limited, waiting...")
-            time.sleep(60)
+            _wait_for_rate_limit(response)
             return get_github_username_from_api(email)
         
         # Cache negative result
-        _github_username_cache[email] = None
+        _cache_username(email, None)
         return None
     except Exception as e:
         print(f"  Warning: GitHub API lookup failed for {email}: {e}")
         return None
 
 
+# Optional checked-in manifest of {filename: github_username} in the submissions directory,
+# and the side file where usernames resolved from git/GitHub are recorded for the next run
+_author_manifest_name = "authors.json"
+_author_auto_manifest_name = "authors.auto.json"
+_author_manifests = {}  # submissions directory -> (manifest, auto manifest)
+# authors.auto.json holds {filename: {'username', 'ts'}}; its entries expire after
+# _github_cache_max_age like the GitHub API cache, so a changed username is looked up again
+
+
+def _load_author_manifests(submissions_dir):
+    """
+    Get the (manifest, auto manifest) dicts of a submissions directory, loading them on first use.
+    """
+    with _github_cache_lock:
+        if submissions_dir not in _author_manifests:
+            manifests = []
+            for name in (_author_manifest_name, _author_auto_manifest_name):
+                try:
+                    with open(os.path.join(submissions_dir, name)) as f:
+                        manifest = dict(json.load(f))
+                    if name == _author_auto_manifest_name:
+                        # Drop expired entries (and entries without a time stamp)
+                        now = time.time()
+                        manifest = {filename: entry for filename, entry in manifest.items()
+                                    if isinstance(entry, dict) and entry.get('username')
+                                    and now - entry.get('ts', 0) < _github_cache_max_age}
+                    manifests.append(manifest)
+                except FileNotFoundError:
+                    manifests.append({})
+                except (OSError, ValueError, TypeError) as e:
+                    print(f"  Warning: Could not read {name}: {e}")
+                    manifests.append({})
+            _author_manifests[submissions_dir] = tuple(manifests)
+        return _author_manifests[submissions_dir]
+
+
+def _manifest_username(file_path):
+    """
+    Get the GitHub username of a submission file from the author manifests, or None.
+    """
+    submissions_dir, filename = os.path.split(os.path.abspath(file_path))
+    manifest, auto_manifest = _load_author_manifests(submissions_dir)
+    return manifest.get(filename) or auto_manifest.get(filename, {}).get('username')
+
+
+def _record_username(file_path, username):
+    """
+    Record a resolved GitHub username in authors.auto.json, so the next runs (until the entry
+    expires) don't look it up again.
+    """
+    submissions_dir, filename = os.path.split(os.path.abspath(file_path))
+    _, auto_manifest = _load_author_manifests(submissions_dir)
+    with _github_cache_lock:
+        auto_manifest[filename] = {'username': username, 'ts': time.time()}
+        try:
+            auto_path = os.path.join(submissions_dir, _author_auto_manifest_name)
+            with open(auto_path + ".tmp", 'w') as f:
+                json.dump(auto_manifest, f, indent=2, sort_keys=True)
+            os.replace(auto_path + ".tmp", auto_path)
+        except OSError as e:
+            print(f"  Warning: Could not save {_author_auto_manifest_name}: {e}")
+
+
+# GitHub noreply commit email, ID+username@users.noreply.github.com
+_noreply_email_re = re.compile(r'^\d+\+(?P<user>[^@]+)@users\.noreply\.github\.com$', re.IGNORECASE)
+
+# Author (email, name) of the most recent commit for each submission file
+_last_commit_authors = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _git_toplevel(repo_dir):
+    """
+    Get the (real) top-level directory of the git repository containing repo_dir, or None.
+    
+    git log --name-only prints paths relative to the top level, wherever it is run from.
+    """
+    try:
+        result = subprocess.run(['git', '-C', repo_dir, 'rev-parse', '--show-toplevel'],
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return os.path.realpath(result.stdout.strip())
+
+
+def _batch_last_authors(repo_dir, missing):
+    """
+    Record the author of the most recent commit for each file in missing, using one git log call.
+    
+    Args:
+        repo_dir: Top-level directory of the git repository
+        missing: dict of path relative to repo_dir -> file path
+    """
+    # With -z, file names are NUL-terminated; each commit header starts with \x01 and
+    # its author name is separated from the first file name by a newline
+    result = subprocess.run([
+        'git', '--literal-pathspecs', '-C', repo_dir, '-c', 'core.quotePath=false',
+        'log', '-z', '--pretty=format:%x01%ae%x00%an', '--name-only', '--', *missing
+    ], capture_output=True, text=True, timeout=60, check=True)
+    
+    # Commits are listed newest first, so the first commit that names a file is its most recent one
+    author = None
+    tokens = iter(result.stdout.split('\0'))
+    for token in tokens:
+        token = token.lstrip('\n')
+        if token.startswith('\x01'):
+            email = token[1:]
+            name, _, token = next(tokens, '').partition('\n')
+            author = (email.strip(), name.strip())
+        if author and token in missing and missing[token] not in _last_commit_authors:
+            _last_commit_authors[missing[token]] = author
+
+
+def _single_last_author(repo_dir, rel_path):
+    """
+    Get the author (email, name) of the most recent commit for one file (rel_path relative
+    to the top-level directory repo_dir), or None.
+    """
+    result = subprocess.run([
+        'git', '--literal-pathspecs', '-C', repo_dir,
+        'log', '-1', '--pretty=format:%ae%x09%an', '--', rel_path
+    ], capture_output=True, text=True, timeout=10)
+    
+    if result.returncode == 0 and result.stdout.strip():
+        email, _, name = result.stdout.strip().partition('\t')
+        return email.strip(), name.strip()
+    return None
+
+
+def _collect_last_author_emails(repo_dir, file_paths):
+    """
+    Get the author of the most recent commit for several files using a single git log pass.
+    
+    Results are memoized, so only files not seen before are passed to git.
+    
+    Args:
+        repo_dir: A directory in the git repository
+        file_paths: Paths of the files to look up
+        
+    Returns:
+        dict: file path -> (email, name), for the files found in the git history
+    """
+    # Paths relative to the top level, as git log prints them; both sides are resolved
+    # with realpath, so symlinks or a repo_dir below the top level still match
+    toplevel = _git_toplevel(repo_dir)
+    missing = {}
+    for file_path in file_paths:
+        if toplevel and file_path not in _last_commit_authors:
+            rel_path = os.path.relpath(os.path.realpath(file_path), toplevel)
+            missing[rel_path.replace(os.sep, '/')] = file_path
+    
+    if missing:
+        try:
+            _batch_last_authors(toplevel, missing)
+        except (OSError, subprocess.SubprocessError) as e:
+            # e.g. command line too long for many files; look the files up one at a time instead
+            print(f"Warning: batch git log failed ({e}), looking up authors per file")
+            for rel_path, file_path in missing.items():
+                author = _single_last_author(toplevel, rel_path)
+                if author:
+                    _last_commit_authors[file_path] = author
+    
+    return {f: _last_commit_authors[f] for f in file_paths if f in _last_commit_authors}
+
+
+def _local_github_username(email, author_name):
+    """
+    Get the GitHub username of a commit author without the search API, or (None, None).
+    
+    Returns:
+        tuple: (username, source); source is 'noreply' for a GitHub noreply email
+            (most reliable), 'fork' for a repository fork owner matching the author name
+    """
+    match = _noreply_email_re.match(email)
+    if match:
+        return match.group('user'), 'noreply'
+    
+    fork_info = get_repository_forks()
+    if fork_info and 'forks' in fork_info and author_name:
+        author_name = author_name.lower()
+        # Try to find a fork owner whose username matches the author name
+        for fork_username in fork_info['forks']:
+            if author_name in fork_username.lower() or fork_username.lower() in author_name:
+                return fork_username, 'fork'
+    return None, None
+
+
 def get_github_username(file_path):
     """
     Extract GitHub username from the commit history of a file using GitHub API and fork information.
@@ -631,52 +1052,42 @@ def get_github_username(file_path):
         str: GitHub username or 'unknown' if not found
     """
     try:
+        # Usernames listed in authors.json, or resolved on a previous run
+        username = _manifest_username(file_path)
+        if username:
+            return username
+        
         # Get the directory containing the file (should be the git repo root)
         repo_dir = os.path.dirname(os.path.dirname(file_path))  # Go up from submissions/ to repo root
         
-        # Get the author email of the most recent commit for this file
-        result = subprocess.run([
-            'git', '-C', repo_dir, 'log', '-1', '--pretty=format:%ae', '--', file_path
-        ], capture_output=True, text=True, timeout=10)
+        # Get the author email and name of the most recent commit for this file
+        authors = _collect_last_author_emails(repo_dir, [file_path])
         
-        if result.returncode == 0 and result.stdout.strip():
-            email = result.stdout.strip()
+        if file_path in authors and authors[file_path][0]:
+            email, author_name = authors[file_path]
             
-            # For GitHub noreply emails, extract username directly (most reliable)
-            if '@' in email:
-                userid = email.split('@')[0]
-                if '+' in userid and '@users.noreply.github.com' in email:
-                    # This is a GitHub noreply email - extract username after +
-                    username = userid.split('+')[1]
-                    print(f"  Extracted GitHub username: {username}")
-                    return username
-            
-            # Try to match with repository forks first
-            fork_info = get_repository_forks()
-            if fork_info and 'forks' in fork_info:
-                # Get author name to potentially match with fork usernames
-                author_result = subprocess.run([
-                    'git', '-C', repo_dir, 'log', '-1', '--pretty=format:%an', '--', file_path
-                ], capture_output=True, text=True, timeout=10)
-                
-                if author_result.returncode == 0 and author_result.stdout.strip():
-                    author_name = author_result.stdout.strip().lower()
-                    # Try to find a fork owner whose username matches the author name
-                    for fork_username in fork_info['forks']:
-                        if author_name in fork_username.lower() or fork_username.lower() in author_name:
-                            print(f"  Matched author '{author_name}' to fork owner: {fork_username}")
-                            return fork_username
+            # GitHub noreply email or a matching fork owner (no search API calls)
+            username, source = _local_github_username(email, author_name)
+            if source == 'noreply':
+                print(f"  Extracted GitHub username: {username}")
+                _record_username(file_path, username)
+                return username
+            if source == 'fork':
+                print(f"  Matched author '{author_name.lower()}' to fork owner: {username}")
+                _record_username(file_path, username)
+                return username
             
             # Try GitHub API lookup for other emails
             print(f"  Looking up GitHub username for {email}...")
             username = get_github_username_from_api(email)
             
             if username:
+                _record_username(file_path, username)
                 return username
             
             # Fallback to email parsing if API lookup fails
-            if '@' in email:
-                userid = email.split('@')[0]
+            userid, at, _ = email.partition('@')
+            if at:
                 # Clean up the userid (remove dots, etc.)
                 userid = userid.replace('.', '').replace('-', '')
                 
@@ -694,52 +1105,160 @@ def get_github_username(file_path):
         return 'unknown'
 
 
-def find_port_sin_cell_and_position(cell, log_func=None, visited_cells=None):
+port_cell_name = "port_SiN"  # cells with this in their name are the laser input port of a design
+
+def find_port_sin_cell_and_position(cell, log_func=None):
     """
     Find the first port_SiN instance in a cell and return both the cell and its y-coordinate.
-    Searches recursively through all levels of the cell hierarchy.
+    Direct instances are checked first; deeper levels are then searched in a single pass of
+    KLayout's recursive instance iterator.
     
     Args:
         cell: The cell to search for port_SiN instances
         log_func: Optional logging function
-        visited_cells: Set to track visited cells and prevent infinite recursion
         
     Returns:
-        tuple: (port_cell, y_position) or (None, None) if not found
+        tuple: (port_cell, y_position) or (None, None) if not found;
+            y_position is the center of the port cell in the coordinates of cell
     """
-    if visited_cells is None:
-        visited_cells = set()
-    
-    # Prevent infinite recursion by tracking visited cells
-    if cell.cell_index() in visited_cells:
-        return None, None
-    visited_cells.add(cell.cell_index())
-    
     if log_func:
         log_func(f"Searching for port_SiN instances in cell: {cell.name}")
     
-    # Search through all direct cell instances
+    # Direct instances first, so a port_SiN placed in the cell wins over a nested one
     for inst in cell.each_inst():
-        # Check if the cell name contains "port_SiN"
-        if "port_SiN" in inst.cell.name:
-            # Get the transformed bounding box to find the y position
-            bbox = inst.bbox()
-            y_position = bbox.center().y
+        if port_cell_name in inst.cell.name:
+            y_position = inst.bbox().center().y
             if log_func:
                 log_func(f"Found port_SiN instance '{inst.cell.name}' at y={y_position}")
             return inst.cell, y_position
     
-    # If no port_SiN found in direct instances, recursively search in sub-cells
-    for inst in cell.each_inst():
-        # Recursively search in the sub-cell
-        port_cell, y_position = find_port_sin_cell_and_position(inst.cell, log_func, visited_cells)
-        if port_cell is not None:
-            return port_cell, y_position
+    # Then the deeper levels: only deliver instances of cells whose name contains "port_SiN";
+    # the name matching and the hierarchy traversal run inside KLayout
+    it = cell.begin_instances_rec()
+    it.targets = f"*{port_cell_name}*"
+    if not it.at_end():
+        port_cell = it.inst_cell()
+        # Transformation of the instance into the searched cell
+        trans = it.trans() * it.inst_trans()
+        y_position = trans.trans(port_cell.bbox().center()).y
+        if log_func:
+            log_func(f"Found port_SiN instance '{port_cell.name}' at y={y_position}")
+        return port_cell, y_position
     
     if log_func:
         log_func(f"No port_SiN instances found in cell: {cell.name}")
     return None, None
 
+def scan_submission(cell):
+    """
+    Find the port_SiN cell and the grating coupler (GC) instances in the hierarchy of a cell, in one pass.
+    
+    The cells below the cell are visited in one flat loop, each cell once, and the
+    instances of each cell are read once. GC cells themselves are not searched,
+    since their instances are replaced.
+    
+    Args:
+        cell: The cell to scan
+        
+    Returns:
+        dict: 'port_cell': the first port_SiN cell found, or None
+              'gc_instances': list of (parent cell, GC instance)
+    """
+    ly = cell.layout()
+    
+    # Look up the cell names once; the instances are then matched by cell index
+    cell_indices = [cell.cell_index(), *cell.called_cells()]
+    gc_cell_indices = set()
+    port_cell_indices = set()
+    for cell_index in cell_indices:
+        name = ly.cell_name(cell_index)
+        if "GC" in name:
+            gc_cell_indices.add(cell_index)
+        elif port_cell_name in name:
+            port_cell_indices.add(cell_index)
+    
+    port_cell = None
+    gc_instances = []
+    for parent_index in cell_indices:
+        if parent_index in gc_cell_indices and parent_index != cell_indices[0]:
+            continue
+        parent = ly.cell(parent_index)
+        for inst in parent.each_inst():
+            child_index = inst.cell_index
+            if child_index in gc_cell_indices:
+                gc_instances.append((parent, inst))
+            elif port_cell is None and child_index in port_cell_indices:
+                port_cell = ly.cell(child_index)
+    
+    return {'port_cell': port_cell, 'gc_instances': gc_instances}
+
+
+def find_rightmost_faml_x(cell, cell_faml):
+    """
+    Find the x position of the rightmost FaML instance in the hierarchy of a cell.
+    
+    KLayout's recursive instance iterator walks the hierarchy in C++ and delivers
+    only the FaML instances, with their accumulated transformations.
+    
+    Args:
+        cell: The cell to search
+        cell_faml: The FaML cell
+        
+    Returns:
+        Absolute x position of the rightmost FaML instance, in the coordinates of cell,
+        or None if there are no FaML instances
+    """
+    rightmost_x = None
+    it = cell.begin_instances_rec()
+    it.targets = [cell_faml.cell_index()]
+    while not it.at_end():
+        # Calculate absolute position including all transformations
+        x = (it.trans() * it.inst_trans()).disp.x
+        if debug:
+            print(f"Found FaML instance at absolute x={x}")
+        if rightmost_x is None or x > rightmost_x:
+            rightmost_x = x
+        it.next()
+    return rightmost_x
+
+
+def replace_gc_with_faml(cell, cell_faml, gc_instances=None):
+    """
+    Replace the grating coupler (GC) instances in the hierarchy of a cell with FaML instances.
+    
+    Args:
+        cell: The cell whose hierarchy is modified
+        cell_faml: The FaML cell, or None
+        gc_instances: The (parent cell, GC instance) list from scan_submission(cell), if already scanned
+    """
+    if gc_instances is None:
+        gc_instances = scan_submission(cell)['gc_instances']
+    
+    if not cell_faml:
+        if gc_instances:
+            print("Warning: FaML cell not available for replacement")
+        return
+    
+    # Offset from the FaML origin to its opt1 pin, so the FaML opt1 pin aligns with
+    # the GC position (the GC origin is at its opt1); no offset if the pin is not found
+    faml_pin = cell_faml.find_pin('opt1')
+    if faml_pin:
+        offset_trans = pya.Trans(faml_pin.center.x, faml_pin.center.y)
+    else:
+        offset_trans = pya.Trans()
+    faml_index = cell_faml.cell_index()
+    
+    # Insert all the FaML instances first, then erase the GC instances,
+    # so no instance is erased while its parent is still being changed
+    for parent, inst in gc_instances:
+        parent.insert(pya.CellInstArray(faml_index, offset_trans * inst.trans))
+        if debug:
+            print(f"Replaced GC cell '{inst.cell.name}' at position ({inst.trans.disp.x}, {inst.trans.disp.y}) "
+                  f"with FaML (offset by {offset_trans.disp.x}, {offset_trans.disp.y})")
+    for parent, inst in gc_instances:
+        parent.erase(inst)
+
+
 def create_simplified_piclet(topcell, submission_cell, submission_name, filename, wavelength=1310, y_offset=0):
     """
     Create a simplified PIClet with laser, heater, bond pads, and connect to submission design.
@@ -781,26 +1300,24 @@ def create_simplified_piclet(topcell, submission_cell, submission_name, filename
     submission_cell_new.copy_tree(submission_cell)
     
     # Find port_SiN cell in the submission design
-    port_cell, port_y = find_port_sin_cell_and_position(submission_cell_new, log_func=print)
+    port_cell, port_y = find_port_sin_cell_and_position(submission_cell_new, log_func=print if debug else None)
     
     if port_cell is not None:
         # Add pin directly to the port cell
-        from SiEPIC.utils.layout import make_pin
         # Calculate pin position relative to the port cell's origin
         port_bbox = port_cell.bbox()
         pin_x = int(port_bbox.left - port_bbox.left)  # Left edge of the cell (x=0)
         pin_y = int(0)  # Middle vertically (y=0)
         make_pin(port_cell, 'opt_laser', [pin_x, pin_y], 800, 'PinRec', 180, debug=False)
-        print(f"Added pin to port cell '{port_cell.name}' at left edge, middle vertically [{pin_x}, {pin_y}]")
+        if debug:
+            print(f"Added pin to port cell '{port_cell.name}' at left edge, middle vertically [{pin_x}, {pin_y}]")
         
         # Create Y-branch tree with depth 2
-        from SiEPIC.utils import create_cell2
-        cell_y_branch = create_cell2(ly, 'ebeam_YBranch_te1310', 'EBeam-SiN')
+        cell_y_branch = library_cell(ly, 'ebeam_YBranch_te1310', 'EBeam-SiN')
         if not cell_y_branch:
             raise Exception('Cannot load Y-branch cell')
         
         # Create Y-branch tree with depth 2
-        from SiEPIC.utils.layout import y_splitter_tree
         tree_depth = 1
         inst_tree_in, inst_tree_out, cell_tree = y_splitter_tree(cell, tree_depth=tree_depth, y_splitter_cell=cell_y_branch, library="EBeam-SiN", wg_type=wg_type, draw_waveguides=True)
         
@@ -823,32 +1340,35 @@ def create_simplified_piclet(topcell, submission_cell, submission_name, filename
         submission_inst.transform(pya.Trans(2 * radius * 1e3, submission_GC_dy))
 
         wg = connect_pins_with_waveguide(inst_tree_out[0], 'opt2', submission_inst, 'opt_laser', waveguide_type=wg_type)
-        print(f'waveguide: {wg}')
+        if debug:
+            print(f'waveguide: {wg}')
         
         
         # Create a copy of the student design
-        print(f"Creating copy of student design")
+        if debug:
+            print(f"Creating copy of student design")
         submission_copy = ly.create_cell(submission_cell_new.name + "_copy")
         
-        # Load the layout again to make a fresh copy
-        print(f"Loading fresh copy from {filename}")
-        # Construct full path to submission file
-        import os
+        # Load the layout again to make a fresh copy, independent of the loaded submission_cell
+        # (reusing it, even through a scratch layout, changes the copy's geometry and labels)
+        if debug:
+            print(f"Loading fresh copy from {filename}")
         script_path = os.path.dirname(os.path.realpath(__file__))
-        submissions_path = os.path.join(os.path.dirname(script_path), "submissions")
-        full_filename = os.path.join(submissions_path, filename)
+        full_filename = os.path.join(os.path.dirname(script_path), "submissions", filename)
         layout_copy = pya.Layout()
         layout_copy.read(full_filename)
-        from SiEPIC.utils import top_cell_with_most_subcells_or_shapes
         fresh_top_cell = top_cell_with_most_subcells_or_shapes(layout_copy)
         
         # Explode regular arrays in the copy
-        print(f"    Exploding regular arrays in copy...")
-        exploded_count = explode_regular_arrays(fresh_top_cell, log_func=lambda msg: print(f"      {msg}"))
-        if exploded_count > 0:
-            print(f"    Exploded {exploded_count} regular arrays in copy")
-        else:
-            print(f"    No regular arrays found in copy")
+        if debug:
+            print(f"    Exploding regular arrays in copy...")
+        exploded_count = explode_regular_arrays(
+            fresh_top_cell, log_func=(lambda msg: print(f"      {msg}")) if debug else None)
+        if debug:
+            if exploded_count > 0:
+                print(f"    Exploded {exploded_count} regular arrays in copy")
+            else:
+                print(f"    No regular arrays found in copy")
 
         # Create sub-cell under subcell cell, using user's cell name
         subcell_copy = ly.create_cell(fresh_top_cell.name+'_copy')
@@ -857,82 +1377,26 @@ def create_simplified_piclet(topcell, submission_cell, submission_name, filename
         subcell_copy.copy_tree(fresh_top_cell)
         
         # Create FaML cell for GC replacement
-        cell_faml = create_cell2(ly, 'ebeam_dream_FaML_Shuksan_SiN_1310_BB', 'EBeam-Dream')
+        cell_faml = library_cell(ly, 'ebeam_dream_FaML_Shuksan_SiN_1310_BB', 'EBeam-Dream')
         if not cell_faml:
             print("Warning: Could not load FaML cell")
         
-        # Function to recursively find and replace GC cells with FaML in the copy
-        def replace_gc_with_faml(cell, visited_cells=None):
-            if visited_cells is None:
-                visited_cells = set()
-            
-            if cell.cell_index() in visited_cells:
-                return []
-            
-            visited_cells.add(cell.cell_index())
-            gc_positions = []
-            
-            # Check all instances in this cell
-            instances_to_replace = []
-            for inst in cell.each_inst():
-                inst_cell = ly.cell(inst.cell_index)
-                if "GC" in inst_cell.name:
-                    instances_to_replace.append(inst)
-                    # Store GC position for reference (no accumulated transformation needed)
-                    gc_bbox = inst_cell.bbox().transformed(inst.trans)
-                    gc_positions.append((gc_bbox.center().x, gc_bbox.center().y))
-            
-            # Replace GC instances with FaML
-            for inst in instances_to_replace:
-                inst_cell = ly.cell(inst.cell_index)
-                print(f"Replacing GC cell '{inst_cell.name}' with FaML in copy")
-                
-                if cell_faml:
-                    # Calculate offset between FaML origin and opt1 pin
-                    faml_pin = cell_faml.find_pin('opt1')
-                    if faml_pin:
-                        # Get the offset from FaML origin to opt1 pin
-                        pin_offset_x = faml_pin.center.x
-                        pin_offset_y = faml_pin.center.y
-                        
-                        # Apply the offset to position FaML so its opt1 pin aligns with GC position
-                        # Since GC origin is at opt1, we need to offset FaML by the pin position
-                        offset_trans = pya.Trans(pin_offset_x, pin_offset_y)
-                        faml_trans = offset_trans * inst.trans
-                        
-                        faml_inst = cell.insert(pya.CellInstArray(cell_faml.cell_index(), faml_trans))
-                        print(f"Replaced GC at position ({inst.trans.disp.x}, {inst.trans.disp.y}) with FaML (offset by {pin_offset_x}, {pin_offset_y})")
-                    else:
-                        # Fallback: use original transformation if pin not found
-                        faml_inst = cell.insert(pya.CellInstArray(cell_faml.cell_index(), inst.trans))
-                        print(f"Replaced GC at position ({inst.trans.disp.x}, {inst.trans.disp.y}) with FaML (no pin offset)")
-                    
-                    # Remove the original GC instance
-                    cell.erase(inst)
-                else:
-                    print("Warning: FaML cell not available for replacement")
-            
-            # Recursively check sub-cells (no need to pass transformations)
-            for inst in cell.each_inst():
-                inst_cell = ly.cell(inst.cell_index)
-                sub_gc_positions = replace_gc_with_faml(inst_cell, visited_cells)
-                gc_positions.extend(sub_gc_positions)
-            
-            return gc_positions
-        
-        # Replace GC cells with FaML in the copy
-        gc_positions = replace_gc_with_faml(subcell_copy)
+        # Find the GC instances and the port_SiN cell of the copy in one pass,
+        # and replace the GC cells with FaML
+        scan = scan_submission(subcell_copy)
+        replace_gc_with_faml(subcell_copy, cell_faml, scan['gc_instances'])
         
-        print(f'Adding port for design {subcell_copy.name}')
+        if debug:
+            print(f'Adding port for design {subcell_copy.name}')
         # Add a pin to the copy cell for Y-branch connection
-        # Find the port_SiN cell in the copy and add a pin
-        port_cell_copy, port_y_copy = find_port_sin_cell_and_position(subcell_copy)
+        port_cell_copy = scan['port_cell']
         if port_cell_copy:
             port_bbox_copy = port_cell_copy.bbox()
             pin_x_copy = int(port_bbox_copy.left - port_bbox_copy.left)  # 0, left edge
             pin_y_copy = int(0)  # middle vertically
             make_pin(port_cell_copy, 'opt_laser', [pin_x_copy, pin_y_copy], 800, 'PinRec', 180, debug=False)
-            print(f"Added opt_laser pin to copy port cell")
+            if debug:
+                print(f"Added opt_laser pin to copy port cell")
         else:
             print("Warning: Could not find port_SiN in copy for pin creation")
 
@@ -947,31 +1411,10 @@ def create_simplified_piclet(topcell, submission_cell, submission_name, filename
                 
         # Find the absolute position of the FaML cell and align it with chip edge
         if cell_faml:
-            # Function to find FaML positions in the layout by traversing the hierarchy
-            def find_faml_positions(cell, parent_transform=pya.Trans()):
-                faml_positions = []
-                for inst in cell.each_inst():
-                    inst_cell = ly.cell(inst.cell_index)
-                    # Check if this instance is a FaML cell
-                    if inst_cell.name == cell_faml.name:
-                        # Calculate absolute position including all transformations
-                        absolute_trans = parent_transform * inst.trans
-                        faml_positions.append(absolute_trans.disp.x)
-                        print(f"Found FaML instance at absolute x={absolute_trans.disp.x}")
-                    else:
-                        # Recursively check sub-cells
-                        sub_transform = parent_transform * inst.trans
-                        sub_faml_positions = find_faml_positions(inst_cell, sub_transform)
-                        faml_positions.extend(sub_faml_positions)
-                return faml_positions
-            
-            # Find all FaML positions in the copy
-            faml_positions = find_faml_positions(subcell_copy, pya.Trans())
+            # Find the rightmost FaML position in the copy
+            rightmost_faml_x = find_rightmost_faml_x(subcell_copy, cell_faml)
             
-            if faml_positions:
-                # Get the rightmost FaML position
-                rightmost_faml_x = max(faml_positions)
-                
+            if rightmost_faml_x is not None:
                 # Calculate how much to move the copy to align rightmost FaML with chip edge
                 chip_right_edge = die_width/2
                 faml_to_edge_offset = chip_right_edge - rightmost_faml_x
@@ -981,10 +1424,11 @@ def create_simplified_piclet(topcell, submission_cell, submission_name, filename
                 subcell_inst.parent_cell = cell
                 subcell_inst.trans = pya.Trans(pya.Trans.R0, new_copy_x, subcell_inst.trans.disp.y)
                 
-                print(f"Found rightmost FaML at absolute x={rightmost_faml_x}")
-                print(f"Chip right edge at x={chip_right_edge}")
-                print(f"Moving copy by {faml_to_edge_offset} to align FaML with chip edge")
-                print(f"Copy repositioned to x={new_copy_x}")
+                if debug:
+                    print(f"Found rightmost FaML at absolute x={rightmost_faml_x}")
+                    print(f"Chip right edge at x={chip_right_edge}")
+                    print(f"Moving copy by {faml_to_edge_offset} to align FaML with chip edge")
+                    print(f"Copy repositioned to x={new_copy_x}")
             else:
                 print("No FaML cells found in copy")
         
@@ -992,24 +1436,22 @@ def create_simplified_piclet(topcell, submission_cell, submission_name, filename
         connect_pins_with_waveguide(inst_tree_out[0], 'opt3', subcell_inst, 'opt_laser',
                                     waveguide_type=wg_type)
         
-        print(f"Positioned student design copy at x={subcell_inst.trans.disp.x}")
-        print(f"Copy positioned down 250 µm from tree")
-        print(f"Connected tree output 2 to student copy")
+        if debug:
+            print(f"Positioned student design copy at x={subcell_inst.trans.disp.x}")
+            print(f"Copy positioned down 250 µm from tree")
+            print(f"Connected tree output 2 to student copy")
         
     else:
         print(f"No port_SiN found in submission {submission_name}, using fallback connection")
         # Fallback: create pin at submission cell center and connect manually
-        from SiEPIC.utils.layout import make_pin
         make_pin(submission_cell_new, 'opt_laser', [submission_bbox.width()//2, 0], 800, 'PinRec', 0)
         
         # Create Y-branch tree with depth 2
-        from SiEPIC.utils import create_cell2
-        cell_y_branch = create_cell2(ly, 'ebeam_YBranch_te1310', 'EBeam-SiN')
+        cell_y_branch = library_cell(ly, 'ebeam_YBranch_te1310', 'EBeam-SiN')
         if not cell_y_branch:
             raise Exception('Cannot load Y-branch cell')
         
         # Create Y-branch tree with depth 2
-        from SiEPIC.utils.layout import y_splitter_tree
         tree_depth = 2
         inst_tree_in, inst_tree_out, cell_tree = y_splitter_tree(cell, tree_depth=tree_depth, y_splitter_cell=cell_y_branch, library="EBeam-SiN", wg_type=wg_type, draw_waveguides=True)
         
@@ -1033,7 +1475,7 @@ def create_simplified_piclet(topcell, submission_cell, submission_name, filename
         # Connection already established via connect_cell above
         
         # Create FaML cell on the right edge of the chip as reference path
-        cell_faml = create_cell2(ly, 'ebeam_dream_FaML_Shuksan_SiN_1310_BB', 'EBeam-Dream')
+        cell_faml = library_cell(ly, 'ebeam_dream_FaML_Shuksan_SiN_1310_BB', 'EBeam-Dream')
         if cell_faml:
             # Position FaML exactly at the right edge of the chip, rotated 180°
             faml_x = die_width/2  # Exactly at right edge
@@ -1044,13 +1486,18 @@ def create_simplified_piclet(topcell, submission_cell, submission_name, filename
             # Connect the second tree output (opt3) to FaML
             connect_pins_with_waveguide(inst_tree_out[0], 'opt3', faml_inst, 'opt1',
                                    waveguide_type=wg_type)
-            print(f"Created FaML cell on right edge at x={faml_x}")
+            if debug:
+                print(f"Created FaML cell on right edge at x={faml_x}")
         else:
             print("Warning: Could not load FaML cell")
     
     return inst
 
 
+# Keywords of the (lowercased) verification output lines that can count as an error
+_verification_keyword_re = re.compile(r'disconnected pin|floating shape|invalid component|missing pin|error|warning|fail')
+
+
 def parse_verification_errors(verification_output):
     """
     Parse verification output to categorize different types of errors.
@@ -1070,9 +1517,17 @@ def parse_verification_errors(verification_output):
         'other_errors': 0
     }
     
-    lines = verification_output.split('\n')
-    for line in lines:
-        line_lower = line.lower()
+    # Lowercase the output once, and only look at the lines that contain one of the keywords
+    output_lower = verification_output.lower()
+    match = _verification_keyword_re.search(output_lower)
+    while match:
+        line_start = output_lower.rfind('\n', 0, match.start()) + 1
+        line_end = output_lower.find('\n', match.end())
+        if line_end < 0:
+            line_end = len(output_lower)
+        line_lower = output_lower[line_start:line_end]
+        match = _verification_keyword_re.search(output_lower, line_end + 1)
+        
         if 'disconnected pin' in line_lower:
             error_counts['disconnected_pins'] += 1
         elif 'floating shape' in line_lower:
@@ -1090,104 +1545,142 @@ def parse_verification_errors(verification_output):
     return error_counts
 
 
+def verify_submission(file_path):
+    """
+    Load a submission and run the design verification on it; runs in a worker process.
+    
+    Args:
+        file_path: Path to the GDS/OAS file
+        
+    Returns:
+        tuple: (messages, passed, error_details)
+            messages: List of log lines for the file
+            passed: False if the file should be skipped
+            error_details: Dictionary with error types as keys and counts as values
+    """
+    from SiEPIC.verification import layout_check
+    
+    filename = os.path.basename(file_path)
+    messages = []
+    
+    # Load layout, and find the top cell using robust method
+    cell, layout = load_submission_cell(file_path)
+    
+    # Note: Regular array explosion will be done on the copy during PIClet creation
+    
+    # Cheap checks first, so empty or near-empty files skip the full verification
+    bbox = cell.bbox()
+    if bbox.width() < 1000 or bbox.height() < 1000:  # Less than 1 µm
+        messages.append(f"  SKIPPING: Cell too small (likely empty) in {filename}")
+        return messages, False, {'cell_too_small': 1}
+    shape_count = 0
+    it = pya.RecursiveShapeIterator(layout, cell, layout.layer_indexes())
+    while not it.at_end() and shape_count < min_submission_shapes:
+        shape_count += 1
+        it.next()
+    if shape_count < min_submission_shapes:
+        messages.append(f"  SKIPPING: Only {shape_count} shapes (likely empty) in {filename}")
+        return messages, False, {'too_few_shapes': 1}
+    
+    # Run verification on the submission
+    messages.append(f"  Running verification...")
+    try:
+        # A single verbose run gives both the number of errors and the details
+        captured_output = io.StringIO()
+        with contextlib.redirect_stdout(captured_output):
+            num_errors = layout_check(cell=cell, verbose=True, GUI=False)
+        
+        error_details = {}
+        if num_errors > 0:
+            # Parse error types
+            error_details = parse_verification_errors(captured_output.getvalue())
+            
+            # Check for critical errors (disconnected pins)
+            if error_details.get('disconnected_pins', 0) > 0:
+                messages.append(f"  SKIPPING: Found {error_details['disconnected_pins']} disconnected pins in {filename}")
+                return messages, False, error_details
+            
+            messages.append(f"  Warning: {num_errors} verification errors found, but continuing")
+            for error_type, count in error_details.items():
+                if count > 0:
+                    messages.append(f"    {error_type}: {count}")
+        else:
+            messages.append(f"  ✓ Verification passed")
+            
+    except Exception as e:
+        messages.append(f"  Warning: Verification failed for {filename}: {e}")
+        # Fall back to the basic validation above
+        messages.append(f"  ✓ Basic validation passed")
+        error_details = {'verification_failed': 1}
+    
+    messages.append(f"  ✓ Loaded successfully")
+    return messages, True, error_details
+
+
 def load_submission_designs(submissions_path):
     """
-    Load all submission designs from the submissions directory with verification.
-    Skips files with disconnected pins or other critical errors.
+    Find and verify all submission designs in the submissions directory.
+    Skips files with disconnected pins or other critical errors. The files are
+    verified in parallel worker processes (piclet_workers); the layouts are not
+    kept here, since each PIClet worker loads its own submissions.
     
     Args:
         submissions_path: Path to the submissions directory
         
     Returns:
         tuple: (submissions_list, error_summary_dict)
-            submissions_list: List of tuples (filename, cell, layout, username)
+            submissions_list: List of tuples (filename, username)
             error_summary_dict: Dictionary with error summary statistics
     """
     submissions = []
+    loaded = []  # Files that passed verification: (path, filename)
     username_counts = {}  # Track how many files per username
     error_summary = {}  # Track errors by filename
     
-    # Get all GDS/OAS files
-    files_in = []
-    for f in os.listdir(submissions_path):
-        if f.lower().endswith(('.gds', '.oas')):
-            files_in.append(os.path.join(submissions_path, f))
+    # Get all GDS/OAS files; scandir reports the file type without a stat call per file
+    with os.scandir(submissions_path) as entries:
+        files_in = [entry.path for entry in entries
+                    if entry.name.lower().endswith(('.gds', '.oas')) and entry.is_file()]
 
     if process_num_submissions > 0:
         files_in = files_in[0:process_num_submissions]
+    files_in = sorted(files_in)
 
+    # Verify the files in parallel worker processes
+    results = []
+    if files_in:
+        max_workers = min(piclet_workers, len(files_in))
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            results = list(executor.map(verify_submission, files_in))
     
-    for f in sorted(files_in):
+    for f, (messages, passed, error_details) in zip(files_in, results):
         filename = os.path.basename(f)
         print(f"Loading submission: {filename}")
+        for message in messages:
+            print(message)
         
-        # Load layout
-        layout = pya.Layout()
-        layout.read(f)
-        
-        # Find the top cell using robust method
-        from SiEPIC.utils import top_cell_with_most_subcells_or_shapes
-        cell = top_cell_with_most_subcells_or_shapes(layout)
-        
-        import siepic_ebeam_pdk
-        layout.technology_name = 'EBeam'
-        
-        # Note: Regular array explosion will be done on the copy during PIClet creation
-        
-        # Run verification on the submission
-        print(f"  Running verification...")
-        try:
-            num_errors = layout_check(cell=cell, verbose=False, GUI=False)
-            
-            # Get detailed error information by capturing verbose output
-            error_details = {}
-            if num_errors > 0:
-                import io
-                import sys
-                
-                # Capture verification output
-                old_stdout = sys.stdout
-                sys.stdout = captured_output = io.StringIO()
-                try:
-                    layout_check(cell=cell, verbose=True, GUI=False)
-                except:
-                    pass
-                finally:
-                    sys.stdout = old_stdout
-                
-                verification_output = captured_output.getvalue()
-                
-                # Parse error types
-                error_details = parse_verification_errors(verification_output)
-                
-                # Check for critical errors (disconnected pins)
-                if error_details.get('disconnected_pins', 0) > 0:
-                    print(f"  SKIPPING: Found {error_details['disconnected_pins']} disconnected pins in {filename}")
-                    error_summary[filename] = error_details
-                    continue
-                
-                if num_errors > 0:
-                    print(f"  Warning: {num_errors} verification errors found, but continuing")
-                    for error_type, count in error_details.items():
-                        if count > 0:
-                            print(f"    {error_type}: {count}")
-                else:
-                    print(f"  ✓ Verification passed")
-                
-        except Exception as e:
-            print(f"  Warning: Verification failed for {filename}: {e}")
-            # Fallback to simple validation
-            bbox = cell.bbox()
-            if bbox.width() < 1000 or bbox.height() < 1000:  # Less than 1 µm
-                print(f"  SKIPPING: Cell too small (likely empty) in {filename}")
-                error_summary[filename] = {'error': 'Cell too small'}
-                continue
-            print(f"  ✓ Basic validation passed")
-            error_details = {'verification_failed': 1}
-        
-        # Get GitHub username
-        username = get_github_username(f)
-        
+        # Store error details for this file
+        error_summary[filename] = error_details
+        if passed:
+            loaded.append((f, filename))
+    
+    # Get GitHub usernames. The commit authors of all files are read with one git log call;
+    # files listed in the author manifests need no lookup. The search API lookups are network
+    # bound, so they run concurrently, once per unique email (several files often share an
+    # author, and the search API allows only a few requests per minute); the usernames of the
+    # files are then taken from the cache.
+    print(f"Looking up GitHub usernames for {len(loaded)} submissions...")
+    unlisted = [f for f, _ in loaded if not _manifest_username(f)]
+    authors = _collect_last_author_emails(os.path.dirname(submissions_path), unlisted)
+    search_emails = sorted({email for email, author_name in authors.values()
+                            if email and email not in _github_username_cache
+                            and _local_github_username(email, author_name)[0] is None})
+    if search_emails:
+        with ThreadPoolExecutor(max_workers=_github_lookup_workers) as executor:
+            list(executor.map(get_github_username_from_api, search_emails))
+    usernames = [get_github_username(f) for f, _ in loaded]
+    
+    for (f, filename), username in zip(loaded, usernames):
         # Handle duplicate usernames by adding numbers
         if username in username_counts:
             username_counts[username] += 1
@@ -1196,12 +1689,8 @@ def load_submission_designs(submissions_path):
             username_counts[username] = 1
             username_with_number = username
         
-        print(f"  GitHub username: {username_with_number}")
-        print(f"  ✓ Loaded successfully")
-        submissions.append((filename, cell, layout, username_with_number))
-        
-        # Store error details for this file
-        error_summary[filename] = error_details
+        print(f"  GitHub username for {filename}: {username_with_number}")
+        submissions.append((filename, username_with_number))
          
     return submissions, error_summary
 
@@ -1215,8 +1704,9 @@ def ground_wire(topcell):
     ymin, ymax = [], []
     for c in components:
         if c.component == "ebeam_dream_Laser_SiN_1310_Bond_BB":
-            ymin.append(c.cell.bbox().transformed(c.trans).bottom)
-            ymax.append(c.cell.bbox().transformed(c.trans).top)
+            bbox = c.cell.bbox().transformed(c.trans)
+            ymin.append(bbox.bottom)
+            ymax.append(bbox.top)
     print(ymin, ymax)
     # Wire from the smallest ymax to the highest ymin
     wire = pya.Path([pya.Point(-die_width/2 + ground_wire_width/2, min(ymax)), 
@@ -1230,8 +1720,8 @@ def loopback_gc(cell, gc_x, gc_y_start, fiber_pitch, wg_type):
     global count
     ly=cell.layout()
     count += 1
-    cell_gc = create_cell2(ly, f'GC_SiN_TE_{1310}_8degOxide_BB', 'EBeam-SiN')
-    cell_taper = create_cell2(ly, 'taper_SiN_750_800', 'EBeam-SiN')
+    cell_gc = library_cell(ly, f'GC_SiN_TE_{1310}_8degOxide_BB', 'EBeam-SiN')
+    cell_taper = library_cell(ly, 'taper_SiN_750_800', 'EBeam-SiN')
 
     # Loopback for GC alignment
     # Instantiate GC + taper combinations
@@ -1355,6 +1845,34 @@ def print_error_summary_table(error_summary):
     print(f"  Total error count: {total_errors}")
 
 
+# Logos already read (and moved into place), file path -> (layout, top cell)
+_logo_cells = {}
+
+
+def load_logo_cell(logo_path):
+    """
+    Read a logo file and position it at the bottom-left corner of the chip.
+    
+    The logo is read only once per run (and worker process); the returned
+    cell is shared, so only copy from it.
+    
+    Args:
+        logo_path: Path to the logo layout file
+        
+    Returns:
+        pya.Cell: The top cell of the logo layout
+    """
+    if logo_path not in _logo_cells:
+        logo_layout = pya.Layout()
+        logo_layout.read(logo_path)
+        logo_cell = logo_layout.top_cell()
+        # Position logo at bottom-left corner of the chip
+        logo_cell.transform(pya.Trans(-die_width/2, -die_height/2))
+        # Keep a reference to the layout, which owns the cell
+        _logo_cells[logo_path] = (logo_layout, logo_cell)
+    return _logo_cells[logo_path][1]
+
+
 def create_piclet_layout(ly, filename, submission_name, submission_cell, filename2=None, submission_name2=None, submission_cell2=None):
     """
     Create and return a PIClet layout for a single submission.
@@ -1390,11 +1908,7 @@ def create_piclet_layout(ly, filename, submission_name, submission_cell, filenam
             logo_path = "/Users/lukasc/Documents/GitHub/SiEPIC_Shuksan_ANT_SiN_2025_08/designs/KLayout Python/dreamlogo_outline.oas"
         
         if os.path.exists(logo_path):
-            logo_layout = pya.Layout()
-            logo_layout.read(logo_path)
-            logo_cell = logo_layout.top_cell()
-            # Position logo at bottom-left corner of the chip
-            logo_cell.transform(pya.Trans(-die_width/2, -die_height/2))
+            logo_cell = load_logo_cell(logo_path)
             topcell.copy_shapes(logo_cell)
             print(f"  Added Dream logo from {logo_path}")
         else:
@@ -1415,9 +1929,214 @@ def create_piclet_layout(ly, filename, submission_name, submission_cell, filenam
     return topcell
 
 
+def load_submission_cell(file_path):
+    """
+    Load a submission file and find its top cell.
+    
+    Args:
+        file_path: Path to the GDS/OAS file
+        
+    Returns:
+        tuple: (cell, layout); keep a reference to the layout while the cell is used
+    """
+    layout = pya.Layout()
+    layout.read(file_path)
+    cell = top_cell_with_most_subcells_or_shapes(layout)
+    layout.technology_name = 'EBeam'
+    return cell, layout
+
+
+def write_piclet_oasis(topcell, path, filename, compression_level=None):
+    """
+    Export a PIClet as OASIS without PCell info or standard properties, like export_layout, but with
+    a configurable compression level, strict mode (with * for invalid name characters) and CBLOCK
+    compression.
+    
+    Each PIClet is a separate file, as the tapeout collects one file per PIClet. The PIClets
+    are not merged into one library with shared PDK cells: merging by cell name would also
+    merge different cells that happen to have the same name in two PIClets (e.g. waveguides).
+    
+    Args:
+        topcell: The top cell to export
+        path: Output directory
+        filename: Output file name, without extension
+        compression_level: OASIS compression level (0-10), default piclet_oasis_compression_level
+        
+    Returns:
+        str: Path of the written file
+    """
+    save_options = pya.SaveLayoutOptions()
+    save_options.write_context_info = False
+    save_options.format = 'OASIS'
+    save_options.oasis_compression_level = (piclet_oasis_compression_level
+                                            if compression_level is None else compression_level)
+    save_options.oasis_strict_mode = True
+    save_options.oasis_write_cblocks = True
+    save_options.oasis_substitution_char = '*'
+    save_options.oasis_write_std_properties = 0  # no S_MAX_*/S_TOP_CELL records
+    save_options.oasis_permissive = True
+    
+    file_out = os.path.join(path, filename + '.oas')
+    topcell.write(file_out, save_options)
+    return file_out
+
+
+def copy_piclet_to_tapeout(file_out, tapeout_dir):
+    """
+    Copy an exported PIClet file to the tapeout folder, so the layout is only encoded once.
+    
+    The file is copied rather than hard-linked, so a later rewrite of the working
+    PIClet file never changes the delivered tapeout file.
+    
+    Args:
+        file_out: Path of the exported PIClet
+        tapeout_dir: The tapeout folder, which must exist
+        
+    Returns:
+        str: Path of the file in the tapeout folder
+    """
+    return shutil.copy2(file_out, tapeout_dir)
+
+
+def new_piclet_layout(piclet_name):
+    """
+    Create the layout of one PIClet, with its time stamp.
+    
+    Each PIClet gets its own Layout, so the PIClets can be built and exported
+    independently. A new Layout costs tens of microseconds; reusing one would keep
+    the previous PIClet's submission copies and library cells (see library_cell)
+    around, so it is not worth it.
+    
+    Args:
+        piclet_name: Name of the top cell
+        
+    Returns:
+        tuple: (topcell, layout)
+    """
+    topcell, ly = new_layout(pdk.tech.name, piclet_name, overwrite=True)
+    ly.dbu = 0.001
+    ly.technology_name = pdk.tech.name
+    add_time_stamp(topcell, layerinfo=pya.LayerInfo(10,0))
+    return topcell, ly
+
+
+def generate_piclet(submissions_path, piclets_path, piclet_submissions, gc_count=0, tapeout_dir=None):
+    """
+    Generate and export the PIClet for one or two submissions.
+    
+    Runs in a worker process, so the submissions are passed by filename and loaded here.
+    
+    Args:
+        submissions_path: Path to the submissions directory
+        piclets_path: Output directory for the PIClet layouts
+        piclet_submissions: List of (filename, username) tuples, one or two submissions
+        gc_count: Number of alignment loopbacks in the PIClets before this one (for unique labels)
+        tapeout_dir: Folder to also add the PIClet to for the tapeout, or None
+        
+    Returns:
+        str: Path of the exported layout, or None if the generation failed
+    """
+    global count
+    count = gc_count
+    
+    if len(piclet_submissions) == 2:
+        # Two submissions per PIClet
+        (filename1, username1), (filename2, username2) = piclet_submissions
+        print(f"Generating PIClet for pair: {username1} and {username2}")
+        
+        try:
+            # Load the submission designs (the layouts stay referenced while the cells are used)
+            loaded = [load_submission_cell(os.path.join(submissions_path, filename))
+                      for filename, _ in piclet_submissions]
+            submission_cell1, submission_cell2 = loaded[0][0], loaded[1][0]
+            
+            # Create new layout for this PIClet
+            piclet_name = f"PIClet-3x3-{username1}-{username2}"
+            topcell, ly = new_piclet_layout(piclet_name)
+            
+            # Create the PIClet layout with both submissions
+            topcell = create_piclet_layout(ly, filename1, username1, submission_cell1,
+                                        filename2, username2, submission_cell2)
+
+
+            # Loopback GC for alignment
+            wg_type = f"SiN Strip TE {1310} nm, w=800 nm"
+            loopback_gc(topcell, 1000e3, -1250e3, fiber_pitch, wg_type)
+            loopback_gc(topcell, 1000e3, 1150e3, fiber_pitch, wg_type)
+            loopback_gc(topcell, 1100e3, -1250e3, fiber_pitch, wg_type)
+            loopback_gc(topcell, 1100e3, 1150e3, fiber_pitch, wg_type)
+            loopback_gc(topcell, 900e3, -1250e3, fiber_pitch, wg_type)
+            loopback_gc(topcell, 900e3, 1150e3, fiber_pitch, wg_type)
+
+            ground_wire(topcell)
+
+            layout_pgtext(topcell, pya.LayerInfo(4, 0), -200, -1170, piclet_name, 20)
+                            
+            # Export layout, and copy the file for the tapeout
+            file_out = write_piclet_oasis(
+                topcell, piclets_path, filename=topcell.name
+            )
+            if show_piclets:
+                topcell.show()
+            if tapeout_dir:
+                copy_piclet_to_tapeout(file_out, tapeout_dir)
+            
+            print(f"  Generated: {file_out}")
+            return file_out
+                
+        except Exception as e:
+            print(f"  Error generating PIClet for {username1}/{username2}: {str(e)}")
+            return None
+                        
+    else:
+        # Single submission (odd number)
+        (filename, username), = piclet_submissions
+        print(f"Generating PIClet for single submission: {username}")
+        
+        try:
+            # Load the submission design (the layout stays referenced while the cell is used)
+            submission_cell, submission_layout = load_submission_cell(os.path.join(submissions_path, filename))
+            
+            # Create new layout for this PIClet
+            piclet_name = f"PIClet-3x3-{username}"
+            topcell, ly = new_piclet_layout(piclet_name)
+            
+            # Create the PIClet layout with single submission
+            topcell = create_piclet_layout(ly, filename, username, submission_cell)
+            
+            # Loopback GC for alignment
+            wg_type = f"SiN Strip TE {1310} nm, w=800 nm"
+            loopback_gc(topcell, 1000e3, -1250e3, fiber_pitch, wg_type)
+            loopback_gc(topcell, 1000e3, 1150e3, fiber_pitch, wg_type)
+
+            layout_pgtext(topcell, pya.LayerInfo(4, 0), -200, -1170, piclet_name, 20)
+            
+            # Export layout, and copy the file for the tapeout
+            file_out = write_piclet_oasis(
+                topcell, piclets_path, filename=topcell.name
+            )
+            if show_piclets:
+                topcell.show()
+            if tapeout_dir:
+                copy_piclet_to_tapeout(file_out, tapeout_dir)
+            
+            print(f"  Generated: {file_out}")
+            return file_out
+            
+        except Exception as e:
+            print(f"  Error generating PIClet for {username}: {str(e)}")
+            return None
+
+
 def generate_piclets():
     """
     Main function to generate PIClets for all submissions.
+    
+    The PIClets are independent, so they are generated in parallel worker processes
+    (piclet_workers); the usernames are resolved here first so the workers don't
+    query GitHub. Each worker builds and exports its own Layout, so one PIClet's
+    export overlaps with the next PIClet's build in the other workers. (KLayout holds
+    the GIL while writing, so an export thread within a worker would not overlap.)
     """
     print("ELEC413 PIClet Generator - 3x3mm")
     
@@ -1433,109 +2152,41 @@ def generate_piclets():
     submissions, error_summary = load_submission_designs(submissions_path)
     print(f"Found {len(submissions)} submissions")
         
-    # Process submissions in pairs
+    # Process submissions in pairs (the last PIClet has a single submission for an odd number)
+    piclet_jobs = []
+    gc_count = 0
     for i in range(0, len(submissions), 2):
-        if i + 1 < len(submissions):
-            # Two submissions per PIClet
-            filename1, submission_cell1, submission_layout1, username1 = submissions[i]
-            filename2, submission_cell2, submission_layout2, username2 = submissions[i + 1]
-            print(f"Generating PIClet for pair: {username1} and {username2}")
-            
-            try:
-                # Create new layout for this PIClet
-                dbu = 0.001
-                piclet_name = f"PIClet-3x3-{username1}-{username2}"
-                topcell, ly = new_layout(pdk.tech.name, piclet_name, overwrite=True)
-                ly.dbu = dbu
-                ly.technology_name = pdk.tech.name
-                from SiEPIC.utils.layout import add_time_stamp
-                add_time_stamp(topcell, layerinfo=pya.LayerInfo(10,0))    
-                
-                # Create the PIClet layout with both submissions
-                topcell = create_piclet_layout(ly, filename1, username1, submission_cell1,
-                                            filename2, username2, submission_cell2)
-
-
-                # Loopback GC for alignment
-                wg_type = f"SiN Strip TE {1310} nm, w=800 nm"
-                loopback_gc(topcell, 1000e3, -1250e3, fiber_pitch, wg_type)
-                loopback_gc(topcell, 1000e3, 1150e3, fiber_pitch, wg_type)
-                loopback_gc(topcell, 1100e3, -1250e3, fiber_pitch, wg_type)
-                loopback_gc(topcell, 1100e3, 1150e3, fiber_pitch, wg_type)
-                loopback_gc(topcell, 900e3, -1250e3, fiber_pitch, wg_type)
-                loopback_gc(topcell, 900e3, 1150e3, fiber_pitch, wg_type)
-
-                ground_wire(topcell)
-
-                from SiEPIC.utils import layout_pgtext
-                layout_pgtext(topcell, pya.LayerInfo(4, 0), -200, -1170, piclet_name, 20)
-                                
-                # Export layout
-                tapeout_path = "/Users/lukasc/Documents/GitHub/SiEPIC_Shuksan_ANT_SiN_2025_08/submissions/3x3"
-                if os.path.exists(tapeout_path):
-                    file_out = export_layout(
-                        topcell, tapeout_path, filename=topcell.name
-                    )
-                else:  
-                    raise Exception(f"Tapeout path {tapeout_path} does not exist")
-                
-                file_out = export_layout(
-                    topcell, piclets_path, filename=topcell.name
-                )
-                topcell.show()
-                
-                print(f"  Generated: {file_out}")
-                    
-            except Exception as e:
-                print(f"  Error generating PIClet for {username1}/{username2}: {str(e)}")
-                continue
-                            
-        else:
-            # Single submission (odd number)
-            filename, submission_cell, submission_layout, username = submissions[i]
-            print(f"Generating PIClet for single submission: {username}")
-            
-            try:
-                # Create new layout for this PIClet
-                dbu = 0.001
-                piclet_name = f"PIClet-3x3-{username}"
-                topcell, ly = new_layout(pdk.tech.name, piclet_name, overwrite=True)
-                ly.dbu = dbu
-                ly.technology_name = pdk.tech.name
-                from SiEPIC.utils.layout import add_time_stamp
-                add_time_stamp(topcell, layerinfo=pya.LayerInfo(10,0))    
-                
-                # Create the PIClet layout with single submission
-                topcell = create_piclet_layout(ly, filename, username, submission_cell)
-                
-                # Loopback GC for alignment
-                wg_type = f"SiN Strip TE {1310} nm, w=800 nm"
-                loopback_gc(topcell, 1000e3, -1250e3, fiber_pitch, wg_type)
-                loopback_gc(topcell, 1000e3, 1150e3, fiber_pitch, wg_type)
-
-                from SiEPIC.utils import layout_pgtext
-                layout_pgtext(topcell, pya.LayerInfo(4, 0), -200, -1170, piclet_name, 20)
-                
-                # Export layout
-                file_out = export_layout(
-                    topcell, piclets_path, filename=topcell.name
-                )
-                topcell.show()
-                tapeout_path = "/Users/lukasc/Documents/GitHub/SiEPIC_Shuksan_ANT_SiN_2025_08/submissions/3x3"
-                if os.path.exists(tapeout_path):
-                    file_out = export_layout(
-                        topcell, tapeout_path, filename=topcell.name
-                    )
-                else:  
-                    raise Exception(f"Tapeout path {tapeout_path} does not exist")
-                    
-                                
-                
-                print(f"  Generated: {file_out}")
-                
-            except Exception as e:
-                print(f"  Error generating PIClet for {username}: {str(e)}")
-                continue
+        piclet_submissions = submissions[i:i + 2]
+        piclet_jobs.append((piclet_submissions, gc_count))
+        gc_count += 6 if len(piclet_submissions) == 2 else 2  # alignment loopbacks per PIClet
+    
+    # Check the tapeout folder once, rather than in every PIClet job
+    if os.path.isdir(tapeout_path):
+        tapeout_dir = tapeout_path
+    else:
+        tapeout_dir = None
+        print(f"Warning: Tapeout path {tapeout_path} does not exist, the PIClets are only written to {piclets_path}")
+    
+    if piclet_jobs:
+        # Use "spawn": KLayout's C++ state does not survive fork() cleanly
+        max_workers = min(piclet_workers, len(piclet_jobs))
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = [executor.submit(generate_piclet, submissions_path, piclets_path, piclet_submissions, gc_count,
+                                       tapeout_dir)
+                       for piclet_submissions, gc_count in piclet_jobs]
+            # A failed PIClet (or worker) is recorded, and the others are still collected
+            failed = []
+            for (piclet_submissions, _), future in zip(piclet_jobs, futures):
+                usernames = ', '.join(username for _, username in piclet_submissions)
+                try:
+                    if future.result() is None:
+                        failed.append(usernames)
+                except Exception as e:
+                    print(f"  Error generating PIClet for {usernames}: {str(e)}")
+                    failed.append(usernames)
+        print(f"Generated {len(piclet_jobs) - len(failed)} of {len(piclet_jobs)} PIClets")
+        for usernames in failed:
+            print(f"  Failed: {usernames}")
     
     # Display error summary table
     print_error_summary_table(error_summary)
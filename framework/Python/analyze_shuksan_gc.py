@@ -14,6 +14,7 @@ import os
 import sys
 import numpy as np
 import cv2
+from scipy.spatial import cKDTree
 from PIL import Image
 from png_layout_analyzer import PNGLayoutAnalyzer
 
@@ -28,15 +29,22 @@ from SiEPIC.utils import get_technology_by_name
 from SiEPIC.utils.layout import new_layout
 
 def load_shuksan_layout():
-    """Load the shuksan_pcm.oas layout file."""
+    """Load the shuksan_pcm.oas layout file.
+    
+    The user properties are not read, since the analysis does not use them.
+    """
     layout_path = '/Users/lukasc/Documents/GitHub/UBC-ELEC413-2025Fall/framework/shuksan_pcm.oas'
     
     if not os.path.exists(layout_path):
         raise FileNotFoundError(f"Layout file not found: {layout_path}")
     
+    # Skip the properties while reading, so they are never built
+    options = pya.LoadLayoutOptions()
+    options.properties_enabled = False
+    
     # Load the layout directly
     ly = pya.Layout()
-    ly.read(layout_path)
+    ly.read(layout_path, options)
     
     # Set the technology to EBeam
     ly.technology = "EBeam"
@@ -81,48 +89,62 @@ def analyze_grating_couplers_visual(png_path, ly):
     
     # Convert pixel coordinates to layout coordinates
     dbu = ly.dbu
-    image_width = analyzer.img.size[0]
-    image_height = analyzer.img.size[1]
+    image_width = analyzer.size[0]
+    image_height = analyzer.size[1]
     
     # Estimate the layout bounds from the image
     # This is a rough conversion - may need adjustment based on actual layout
     layout_width = image_width * 1000  # Assume 1 pixel = 1000 nm
     layout_height = image_height * 1000
     
-    visual_results = []
+    # Convert all the pixel coordinates to layout coordinates at once
+    # (rough approximation: 1 pixel = 1000 nm), then to GDS units (nm to dbu)
+    pixel_centers = np.array([gc['center'] for gc in grating_couplers]).reshape(-1, 2)
+    layout_centers = pixel_centers * 1000
+    gds_centers = (layout_centers / dbu).astype(np.int64)
     
-    for i, gc in enumerate(grating_couplers):
-        # Convert pixel coordinates to layout coordinates
-        pixel_x, pixel_y = gc['center']
-        
-        # Convert to layout coordinates (rough approximation)
-        layout_x = pixel_x * 1000  # Convert pixels to nm
-        layout_y = pixel_y * 1000
-        
-        # Convert to GDS units (nm to dbu)
-        gds_x = int(layout_x / dbu)
-        gds_y = int(layout_y / dbu)
-        
-        direction = gc['arrow_direction']
-        confidence = gc['confidence']
-        
-        visual_result = {
+    visual_results = [
+        {
             'index': i + 1,
-            'pixel_center': (pixel_x, pixel_y),
-            'layout_center_nm': (layout_x, layout_y),
-            'gds_center': (gds_x, gds_y),
-            'direction': direction,
-            'confidence': confidence,
+            'pixel_center': gc['center'],
+            'layout_center_nm': tuple(layout_center),
+            'gds_center': tuple(gds_center),
+            'direction': gc['arrow_direction'],
+            'confidence': gc['confidence'],
             'area_pixels': gc['area'],
             'bounding_box': gc['bounding_box']
         }
-        
-        visual_results.append(visual_result)
-        
-        print(f"GC {i+1}: GDS({gds_x}, {gds_y}) nm, Direction: {direction}, Confidence: {confidence:.3f}")
+        for i, (gc, layout_center, gds_center)
+        in enumerate(zip(grating_couplers, layout_centers.tolist(), gds_centers.tolist()))
+    ]
+    
+    for result in visual_results:
+        gds_x, gds_y = result['gds_center']
+        print(f"GC {result['index']}: GDS({gds_x}, {gds_y}) nm, Direction: {result['direction']}, Confidence: {result['confidence']:.3f}")
     
     return visual_results
 
+def count_shapes_per_cell(ly, cell_indexes=None):
+    """Count the shapes of each cell including its hierarchy (as begin_shapes_rec would),
+    from the per-layer shape counts of the cells, in a single bottom-up pass.
+    If cell_indexes is given, only these cells and the cells they call are counted."""
+    layer_indexes = ly.layer_indexes()
+    needed = None
+    if cell_indexes is not None:
+        needed = set(cell_indexes)
+        for cell_idx in cell_indexes:
+            needed.update(ly.cell(cell_idx).called_cells())
+    counts = {}
+    for cell_idx in ly.each_cell_bottom_up():
+        if needed is not None and cell_idx not in needed:
+            continue
+        cell = ly.cell(cell_idx)
+        count = sum(cell.shapes(layer_idx).size() for layer_idx in layer_indexes)
+        for inst in cell.each_inst():
+            count += inst.size() * counts[inst.cell_index]
+        counts[cell_idx] = count
+    return counts
+
 def analyze_grating_couplers_auto_coord(ly):
     """Analyze grating couplers by examining the layout structure and available GC cells."""
     print("\n=== LAYOUT STRUCTURE ANALYSIS ===")
@@ -131,6 +153,8 @@ def analyze_grating_couplers_auto_coord(ly):
         # Get the top cell
         top_cell = ly.cell(0)
         dbu = ly.dbu
+        # Layer information, looked up once
+        layer_infos = [ly.get_info(layer_idx) for layer_idx in range(ly.layers())]
         
         print(f"Top cell: {top_cell.name}")
         print(f"Layout has {ly.cells()} cells")
@@ -139,25 +163,27 @@ def analyze_grating_couplers_auto_coord(ly):
         # Find grating coupler cells by name
         gc_cells = []
         for cell_idx in range(ly.cells()):
-            cell = ly.cell(cell_idx)
-            cell_name = cell.name.lower()
-            if any(keyword in cell_name for keyword in ['gc', 'grating', 'coupler']):
-                gc_cells.append((cell_idx, cell.name))
+            cell_name = ly.cell_name(cell_idx)
+            cell_name_lower = cell_name.lower()
+            if any(keyword in cell_name_lower for keyword in ['gc', 'grating', 'coupler']):
+                gc_cells.append((cell_idx, cell_name))
         
         print(f"Found {len(gc_cells)} grating coupler cells:")
         for cell_idx, cell_name in gc_cells:
             print(f"  {cell_name} (index {cell_idx})")
         
-        # Analyze the layout structure
+        # Analyze the layout structure, counting the shapes of all layers in one pass
         print(f"\nLayout structure analysis:")
-        for layer_idx in range(ly.layers()):
-            layer_info = ly.get_info(layer_idx)
-            shape_count = 0
-            iter = top_cell.begin_shapes_rec(layer_idx)
-            while not iter.at_end():
-                shape_count += 1
-                iter.next()
-            print(f"  Layer {layer_idx} ({layer_info.layer}/{layer_info.datatype}): {shape_count} shapes")
+        layer_shape_counts = [0] * len(layer_infos)
+        iter = pya.RecursiveShapeIterator(ly, top_cell, ly.layer_indexes())
+        while not iter.at_end():
+            layer_shape_counts[iter.layer()] += 1
+            iter.next()
+        for layer_idx, layer_info in enumerate(layer_infos):
+            print(f"  Layer {layer_idx} ({layer_info.layer}/{layer_info.datatype}): {layer_shape_counts[layer_idx]} shapes")
+        
+        # Shapes of each cell, including its hierarchy
+        cell_shape_counts = count_shapes_per_cell(ly, [cell_idx for cell_idx, _ in gc_cells])
         
         # Since there are no text labels, we'll analyze the available GC cells
         auto_results = []
@@ -168,18 +194,14 @@ def analyze_grating_couplers_auto_coord(ly):
             # Get the bounding box of the cell
             bbox = cell.bbox()
             if bbox.width() > 0 and bbox.height() > 0:
-                center_x = int((bbox.left + bbox.right) / 2 * dbu)
-                center_y = int((bbox.bottom + bbox.top) / 2 * dbu)
+                center = bbox.center()
+                center_x = int(center.x * dbu)
+                center_y = int(center.y * dbu)
                 width = int(bbox.width() * dbu)
                 height = int(bbox.height() * dbu)
                 
                 # Count shapes in the cell
-                total_shapes = 0
-                for layer_idx in range(ly.layers()):
-                    iter = cell.begin_shapes_rec(layer_idx)
-                    while not iter.at_end():
-                        total_shapes += 1
-                        iter.next()
+                total_shapes = cell_shape_counts[cell_idx]
                 
                 result = {
                     'index': i + 1,
@@ -204,12 +226,11 @@ def analyze_grating_couplers_auto_coord(ly):
         # Check if any of these cells are actually instantiated in the top cell
         print(f"\nChecking for GC cell instances in top cell:")
         instances_found = 0
-        for layer_idx in range(ly.layers()):
-            iter = top_cell.begin_shapes_rec(layer_idx)
+        if gc_cells:
+            iter = top_cell.begin_instances_rec()
+            iter.targets = [cell_idx for cell_idx, _ in gc_cells]
             while not iter.at_end():
-                # Check if this shape references any of our GC cells
-                # This is a simplified check - in a real implementation we'd need to
-                # check for cell instances properly
+                instances_found += 1
                 iter.next()
         
         print(f"Found {instances_found} GC instances in top cell")
@@ -246,23 +267,23 @@ def compare_results(visual_results, auto_results):
         else:
             print(f"  {result['key']}: {result['value']}")
     
-    # Try to match results
+    # Try to match results: find the nearest coordinate result of each visual result
+    # with a KD-tree over the coordinate results, in a single query
     print("\nMatching Analysis:")
     matched = 0
-    for i, visual in enumerate(visual_results):
-        vx, vy = visual['gds_center']
-        best_match = None
-        best_distance = float('inf')
-        
-        for auto in auto_results:
-            if auto['type'] in ['coordinates', 'coordinates_with_info']:
-                ax, ay = auto['position']
-                distance = np.sqrt((vx - ax)**2 + (vy - ay)**2)
-                if distance < best_distance:
-                    best_distance = distance
-                    best_match = auto
-        
-        if best_match and best_distance < 10000:  # Within 10μm
+    coordinate_results = [auto for auto in auto_results
+                          if auto['type'] in ['coordinates', 'coordinates_with_info']]
+    if visual_results and coordinate_results:
+        tree = cKDTree(np.array([auto['position'] for auto in coordinate_results], dtype=float))
+        best_distances, best_indices = tree.query(
+            np.array([visual['gds_center'] for visual in visual_results], dtype=float), k=1)
+    else:
+        best_distances = np.full(len(visual_results), np.inf)
+        best_indices = None
+    
+    for i, best_distance in enumerate(best_distances):
+        if best_distance < 10000:  # Within 10μm
+            best_match = coordinate_results[best_indices[i]]
             print(f"  GC {i+1} matches {best_match['key']} (distance: {best_distance:.0f} dbu)")
             matched += 1
         else:
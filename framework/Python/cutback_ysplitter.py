@@ -69,7 +69,7 @@ from SiEPIC.scripts import connect_pins_with_waveguide, connect_cell, zoom_out,
 from SiEPIC.utils.layout import new_layout, floorplan
 from SiEPIC.utils import get_technology_by_name
 from SiEPIC.extend import to_itype
-from pya import Trans, CellInstArray, Text
+from pya import Trans, CellInstArray, Text, Vector
 
 '''
 Create a new layout
@@ -97,29 +97,27 @@ top_cell.shapes(ly.layer(TECHNOLOGY['FloorPlan'])).insert(box)
 import os
 path = os.path.dirname(os.path.realpath(__file__))
 
-# Place grating couplers vertically spaced by dy_gcs
+# Place grating couplers vertically spaced by dy_gcs, as a single array instance
+num_gcs = 2
 x, y = 10000, 10000  # Starting position
 t = Trans(Trans.R0, x, y)
-instGC1 = top_cell.insert(CellInstArray(cell_ebeam_gc.cell_index(), t))
-
-t = Trans(Trans.R0, x, y + dy_gcs)
-instGC2 = top_cell.insert(CellInstArray(cell_ebeam_gc.cell_index(), t))
+instGCs = top_cell.insert(CellInstArray(cell_ebeam_gc.cell_index(), t,
+                                        Vector(0, dy_gcs), Vector(0, 0), num_gcs, 1))
 
 # Add test labels for grating couplers
-text1 = Text("opt_in_TE_1310_device_%s_GC1" % top_cell_name, Trans(Trans.R0, x, y))
-text1.valign = Text.VAlignTop
-top_cell.shapes(ly.layer(TECHNOLOGY['Text'])).insert(text1).text_size = 5/dbu
-
-text2 = Text("opt_in_TE_1310_device_%s_GC2" % top_cell_name, Trans(Trans.R0, x, y + dy_gcs))
-text2.valign = Text.VAlignTop
-top_cell.shapes(ly.layer(TECHNOLOGY['Text'])).insert(text2).text_size = 5/dbu
+text_shapes = top_cell.shapes(ly.layer(TECHNOLOGY['Text']))
+text_size = 5/dbu
+for i in range(num_gcs):
+    text = Text("opt_in_TE_1310_device_%s_GC%d" % (top_cell_name, i + 1), Trans(Trans.R0, x, y + i * dy_gcs))
+    text.valign = Text.VAlignTop
+    text_shapes.insert(text).text_size = text_size
 
 
 # Export for fabrication
 import os 
 path = os.path.dirname(os.path.realpath(__file__))
 filename = filename_out
-file_out = export_layout(top_cell, path, filename, relative_path = '.', format='oas', screenshot=True)
+file_out = export_layout(top_cell, path, filename, relative_path = '.', format='oas')
 
 
 from SiEPIC._globals import Python_Env
@@ -127,8 +125,9 @@ if Python_Env == "Script":
     from SiEPIC.utils import klive
     klive.show(file_out, technology=tech)
 
-# Create an image of the layout
-top_cell.image(os.path.join(path,filename+'.png'))
+# Create an image of the layout, only if requested: rendering is slow in batch runs
+if os.environ.get('GENERATE_PNG'):
+    top_cell.image(os.path.join(path,filename+'.png'))
 
 
 
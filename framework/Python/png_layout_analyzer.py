@@ -19,7 +19,6 @@ Date: 2024
 
 import numpy as np
 import cv2
-from PIL import Image
 import argparse
 import sys
 from typing import List, Tuple, Dict, Any
@@ -35,9 +34,28 @@ class PNGLayoutAnalyzer:
             image_path: Path to the PNG image file
         """
         self.image_path = image_path
-        self.img = Image.open(image_path)
-        self.img_array = np.array(self.img)
-        self.gray = cv2.cvtColor(self.img_array, cv2.COLOR_RGB2GRAY)
+        # Decode with OpenCV (keeping any alpha channel) and take the grayscale from
+        # the BGR(A) data directly, without an intermediate PIL image
+        img_bgr = cv2.imread(image_path, cv2.IMREAD_UNCHANGED)
+        if img_bgr is None:
+            raise FileNotFoundError(f"Cannot read image: {image_path}")
+        if img_bgr.shape[-1] == 4:
+            self.img_array = cv2.cvtColor(img_bgr, cv2.COLOR_BGRA2RGBA)
+            self.gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGRA2GRAY)
+        else:
+            self.img_array = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
+            self.gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+        self.size = (self.img_array.shape[1], self.img_array.shape[0])
+        self._total_pixels = self.size[0] * self.size[1]
+        self._center = (self.size[0] // 2, self.size[1] // 2)
+        
+        # Pack the channels of each pixel into one integer (in channel order, so packed
+        # colors sort like the RGB tuples); shared by the color analysis and color masks
+        channels = self.img_array.shape[-1]
+        self._packed = np.zeros(self.img_array.shape[:2], dtype=np.uint32)
+        for channel in range(channels):
+            self._packed = (self._packed << 8) | self.img_array[..., channel]
+        self._packed_rgb = self._packed if channels == 3 else self._packed >> 8 * (channels - 3)
         
         # Define color mappings for photonic layouts
         self.color_mappings = {
@@ -48,6 +66,9 @@ class PNGLayoutAnalyzer:
             'pink_magenta': (255, 128, 168),
             'dark_blue': (0, 0, 128)
         }
+        # Reverse lookup from the packed 0xRRGGBB value to the color name
+        self._color_lookup = {(r << 16) | (g << 8) | b: name
+                              for name, (r, g, b) in self.color_mappings.items()}
         
     def analyze_colors(self) -> Dict[str, Any]:
         """Analyze the color distribution in the image.
@@ -57,25 +78,26 @@ class PNGLayoutAnalyzer:
         """
         print("=== COLOR ANALYSIS ===")
         
-        # Get unique colors
-        unique_colors = np.unique(self.img_array.reshape(-1, self.img_array.shape[-1]), axis=0)
-        total_pixels = self.img_array.shape[0] * self.img_array.shape[1]
+        # Get unique colors and their pixel counts in one pass over the packed pixels
+        channels = self.img_array.shape[-1]
+        unique_packed, pixel_counts = np.unique(self._packed, return_counts=True)
+        shifts = 8 * np.arange(channels - 1, -1, -1, dtype=np.uint32)
+        unique_colors = ((unique_packed[:, None] >> shifts) & 0xFF).astype(self.img_array.dtype)
+        total_pixels = self._total_pixels
         
-        print(f"Image dimensions: {self.img.size[0]} x {self.img.size[1]} pixels")
+        print(f"Image dimensions: {self.size[0]} x {self.size[1]} pixels")
         print(f"Total pixels: {total_pixels:,}")
         print(f"Number of unique colors: {len(unique_colors)}")
         
         color_analysis = {
-            'dimensions': self.img.size,
+            'dimensions': self.size,
             'total_pixels': total_pixels,
             'unique_colors': len(unique_colors),
             'color_breakdown': {}
         }
         
         # Analyze each unique color
-        for i, color in enumerate(unique_colors):
-            mask = np.all(self.img_array == color, axis=2)
-            pixel_count = np.sum(mask)
+        for i, (color, pixel_count) in enumerate(zip(unique_colors, pixel_counts)):
             percentage = (pixel_count / total_pixels) * 100
             
             # Try to identify the color
@@ -100,12 +122,12 @@ class PNGLayoutAnalyzer:
         Returns:
             String name of the color
         """
-        r, g, b = color
+        r, g, b = (int(c) for c in color)
         
         # Check against known color mappings
-        for name, rgb in self.color_mappings.items():
-            if np.array_equal(color, rgb):
-                return name
+        name = self._color_lookup.get((r << 16) | (g << 8) | b)
+        if name:
+            return name
         
         # Generic identification based on RGB values
         if r == g == b:
@@ -132,8 +154,10 @@ class PNGLayoutAnalyzer:
         """
         print("\n=== SHAPE ANALYSIS ===")
         
-        # Find contours
-        contours, _ = cv2.findContours(self.gray, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Find contours of the layout structures (every non-white pixel); findContours
+        # expects a binary image, and on the raw grayscale the white background is foreground
+        foreground = (self._packed_rgb != 0xFFFFFF).view(np.uint8)
+        contours, _ = cv2.findContours(foreground, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         print(f"Number of contours found: {len(contours)}")
         
@@ -145,9 +169,10 @@ class PNGLayoutAnalyzer:
         # Analyze each contour
         for i, contour in enumerate(contours):
             area = cv2.contourArea(contour)
-            perimeter = cv2.arcLength(contour, True)
             
             if area > 100:  # Only consider significant shapes
+                perimeter = cv2.arcLength(contour, True)
+                
                 # Get bounding box
                 x, y, w, h = cv2.boundingRect(contour)
                 
@@ -218,7 +243,7 @@ class PNGLayoutAnalyzer:
         print(f"Text pixels (dark): {text_pixels}")
         
         # Find contours of text regions
-        contours, _ = cv2.findContours(text_mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        contours, _ = cv2.findContours(text_mask.view(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         text_regions = []
         for i, contour in enumerate(contours):
@@ -247,29 +272,32 @@ class PNGLayoutAnalyzer:
         """
         print("\n=== GRATING COUPLER ANALYSIS ===")
         
-        # Create mask for blue regions (grating couplers)
-        blue_mask = np.zeros(self.gray.shape, dtype=np.uint8)
-        for y in range(self.img_array.shape[0]):
-            for x in range(self.img_array.shape[1]):
-                pixel = self.img_array[y, x]
-                # Check for medium blue or bright blue
-                if (pixel[0] == 0 and pixel[1] == 64 and pixel[2] == 128) or \
-                   (pixel[0] == 0 and pixel[1] == 0 and pixel[2] == 255):
-                    blue_mask[y, x] = 255
+        # Create mask for blue regions (grating couplers): medium blue or bright blue
+        # (a 0/1 mask is enough: findContours treats any nonzero pixel as foreground)
+        blue_mask = (self._packed_rgb == 0x004080).view(np.uint8)
+        blue_mask |= (self._packed_rgb == 0x0000FF).view(np.uint8)
         
         # Find contours in blue regions
         contours, _ = cv2.findContours(blue_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
-        # Sort by area and filter for significant shapes
-        significant_contours = [(i, c, cv2.contourArea(c)) for i, c in enumerate(contours) if cv2.contourArea(c) > 100]
-        significant_contours.sort(key=lambda x: x[2], reverse=True)
+        # Filter for significant shapes and keep the largest few by area: partition out the
+        # 4th largest area, then stable-sort only the contours at or above it (ties keep
+        # contour order)
+        areas = np.array([cv2.contourArea(c) for c in contours], dtype=float)
+        significant_indexes = np.flatnonzero(areas > 100)
+        largest_indexes = significant_indexes
+        if len(significant_indexes) > 4:
+            cutoff = np.partition(areas[significant_indexes], -4)[-4]
+            largest_indexes = significant_indexes[areas[significant_indexes] >= cutoff]
+        largest_indexes = largest_indexes[np.argsort(-areas[largest_indexes], kind='stable')][:4]
+        largest_contours = [(int(i), contours[i], areas[i]) for i in largest_indexes]
         
         print(f"Found {len(contours)} blue contours")
-        print(f"Found {len(significant_contours)} significant grating couplers")
+        print(f"Found {len(significant_indexes)} significant grating couplers")
         
         grating_couplers = []
         
-        for idx, (contour_idx, contour, area) in enumerate(significant_contours[:4]):  # Analyze top 4
+        for idx, (contour_idx, contour, area) in enumerate(largest_contours):
             print(f"\nGRATING COUPLER {idx+1}:")
             print(f"  Contour index: {contour_idx}")
             print(f"  Area: {area:.0f} pixels")
@@ -287,7 +315,7 @@ class PNGLayoutAnalyzer:
                 print(f"  Center of mass: ({cx}, {cy})")
                 
                 # Analyze the grating coupler direction using the method from our analysis
-                direction, tip, vector, confidence = self._analyze_grating_coupler_direction(contour, cx, cy)
+                direction, tip, vector, confidence = self._analyze_grating_coupler_direction(contour, (x, y, w, h), cx, cy)
                 
                 print(f"  Grating coupler direction: {direction}")
                 print(f"  Arrow tip: {tip}")
@@ -310,13 +338,13 @@ class PNGLayoutAnalyzer:
         
         grating_analysis = {
             'total_contours': len(contours),
-            'significant_contours': len(significant_contours),
+            'significant_contours': len(significant_indexes),
             'grating_couplers': grating_couplers
         }
         
         return grating_analysis
     
-    def _analyze_grating_coupler_direction(self, contour, cx, cy):
+    def _analyze_grating_coupler_direction(self, contour, bbox, cx, cy):
         """Analyze the direction a grating coupler is facing.
         
         Based on our analysis, grating couplers have a triangular/arrow shape where:
@@ -326,30 +354,29 @@ class PNGLayoutAnalyzer:
         
         Args:
             contour: OpenCV contour of the grating coupler
+            bbox: Bounding rectangle (x, y, w, h) of the contour
             cx, cy: Center coordinates of the contour
             
         Returns:
             Tuple of (direction, tip, vector, confidence)
         """
-        # Get all contour points
+        # Split the contour points into contiguous x and y arrays once for both analyzers
         points = contour.reshape(-1, 2)
+        x_coords = np.ascontiguousarray(points[:, 0])
+        y_coords = np.ascontiguousarray(points[:, 1])
         
-        # Get bounding box to determine orientation
-        bbox = cv2.boundingRect(contour)
+        # Use the bounding box to determine orientation
         x, y, w, h = bbox
         aspect_ratio = w / h if h > 0 else 1
         
-        x_coords = points[:, 0]
-        y_coords = points[:, 1]
-        
         # Determine if this is a horizontal or vertical grating coupler
         if aspect_ratio > 1.2:  # Horizontal (wider than tall)
-            direction, tip, vector, confidence = self._analyze_horizontal_gc(points, cx, cy)
+            direction, tip, vector, confidence = self._analyze_horizontal_gc(x_coords, y_coords, cx, cy)
         elif aspect_ratio < 0.8:  # Vertical (taller than wide)
-            direction, tip, vector, confidence = self._analyze_vertical_gc(points, cx, cy)
+            direction, tip, vector, confidence = self._analyze_vertical_gc(x_coords, y_coords, cx, cy)
         else:  # Square-ish, try both methods and pick the best
-            h_dir, h_tip, h_vec, h_conf = self._analyze_horizontal_gc(points, cx, cy)
-            v_dir, v_tip, v_vec, v_conf = self._analyze_vertical_gc(points, cx, cy)
+            h_dir, h_tip, h_vec, h_conf = self._analyze_horizontal_gc(x_coords, y_coords, cx, cy)
+            v_dir, v_tip, v_vec, v_conf = self._analyze_vertical_gc(x_coords, y_coords, cx, cy)
             
             if h_conf > v_conf:
                 direction, tip, vector, confidence = h_dir, h_tip, h_vec, h_conf
@@ -358,27 +385,23 @@ class PNGLayoutAnalyzer:
         
         return direction, tuple(tip), vector, confidence
     
-    def _analyze_horizontal_gc(self, points, cx, cy):
+    def _coordinate_spans(self, bins, values):
+        """Return max(values) - min(values) for each bin index, or -1 for empty bins."""
+        n_bins = np.max(bins) + 1
+        upper = np.full(n_bins, np.iinfo(np.int64).min, dtype=np.int64)
+        lower = np.full(n_bins, np.iinfo(np.int64).max, dtype=np.int64)
+        np.maximum.at(upper, bins, values)
+        np.minimum.at(lower, bins, values)
+        return np.where(upper >= lower, upper - lower, -1)
+    
+    def _analyze_horizontal_gc(self, x_coords, y_coords, cx, cy):
         """Analyze horizontal grating coupler by looking at height distribution across x-coordinates."""
-        x_coords = points[:, 0]
-        y_coords = points[:, 1]
-        
-        # Find the range of x-coordinates
-        x_min, x_max = np.min(x_coords), np.max(x_coords)
+        # Height at each x-coordinate (-1 where the contour has no point)
+        x_min = np.min(x_coords)
+        heights = self._coordinate_spans(x_coords - x_min, y_coords)
         
-        # Calculate height at each x-coordinate
-        heights = {}
-        for x in range(x_min, x_max + 1):
-            y_vals = y_coords[x_coords == x]
-            if len(y_vals) > 0:
-                height = np.max(y_vals) - np.min(y_vals)
-                heights[x] = height
-        
-        if not heights:
-            return self._fallback_direction_analysis(contour, cx, cy)
-        
-        max_height_x = max(heights, key=heights.get)
-        max_height = heights[max_height_x]
+        max_height_x = int(np.argmax(heights)) + x_min
+        max_height = heights[max_height_x - x_min]
         
         # Determine direction based on where the tip is relative to center
         if max_height_x < cx:
@@ -387,47 +410,35 @@ class PNGLayoutAnalyzer:
             direction = 'RIGHT'
         
         # Find the actual tip point
-        tip_points = points[(x_coords == max_height_x)]
-        if len(tip_points) > 0:
-            tip_distances = [np.sqrt((p[0] - cx)**2 + (p[1] - cy)**2) for p in tip_points]
-            tip_idx = np.argmin(tip_distances)
-            tip = tip_points[tip_idx]
+        tip_indexes = np.flatnonzero(x_coords == max_height_x)
+        if len(tip_indexes) > 0:
+            # Closest point to the center (squared distance has the same argmin)
+            tip_distances = (x_coords[tip_indexes] - cx)**2 + (y_coords[tip_indexes] - cy)**2
+            tip_index = tip_indexes[np.argmin(tip_distances)]
+            tip = (x_coords[tip_index], y_coords[tip_index])
         else:
             tip = (max_height_x, cy)
         
         vector = (tip[0] - cx, tip[1] - cy)
         
         # Calculate confidence
-        other_heights = [h for x, h in heights.items() if x != max_height_x]
-        if other_heights:
-            avg_other_height = np.mean(other_heights)
+        present_heights = heights[heights >= 0]
+        if len(present_heights) > 1:
+            avg_other_height = (np.sum(present_heights) - max_height) / (len(present_heights) - 1)
             confidence = max_height / avg_other_height if avg_other_height > 0 else 1.0
         else:
             confidence = 1.0
         
         return direction, tip, vector, confidence
     
-    def _analyze_vertical_gc(self, points, cx, cy):
+    def _analyze_vertical_gc(self, x_coords, y_coords, cx, cy):
         """Analyze vertical grating coupler by looking at width distribution across y-coordinates."""
-        x_coords = points[:, 0]
-        y_coords = points[:, 1]
-        
-        # Find the range of y-coordinates
-        y_min, y_max = np.min(y_coords), np.max(y_coords)
-        
-        # Calculate width at each y-coordinate
-        widths = {}
-        for y in range(y_min, y_max + 1):
-            x_vals = x_coords[y_coords == y]
-            if len(x_vals) > 0:
-                width = np.max(x_vals) - np.min(x_vals)
-                widths[y] = width
-        
-        if not widths:
-            return self._fallback_direction_analysis(contour, cx, cy)
+        # Width at each y-coordinate (-1 where the contour has no point)
+        y_min = np.min(y_coords)
+        widths = self._coordinate_spans(y_coords - y_min, x_coords)
         
-        max_width_y = max(widths, key=widths.get)
-        max_width = widths[max_width_y]
+        max_width_y = int(np.argmax(widths)) + y_min
+        max_width = widths[max_width_y - y_min]
         
         # Determine direction based on where the tip is relative to center
         if max_width_y < cy:
@@ -436,20 +447,21 @@ class PNGLayoutAnalyzer:
             direction = 'DOWN'
         
         # Find the actual tip point
-        tip_points = points[(y_coords == max_width_y)]
-        if len(tip_points) > 0:
-            tip_distances = [np.sqrt((p[0] - cx)**2 + (p[1] - cy)**2) for p in tip_points]
-            tip_idx = np.argmin(tip_distances)
-            tip = tip_points[tip_idx]
+        tip_indexes = np.flatnonzero(y_coords == max_width_y)
+        if len(tip_indexes) > 0:
+            # Closest point to the center (squared distance has the same argmin)
+            tip_distances = (x_coords[tip_indexes] - cx)**2 + (y_coords[tip_indexes] - cy)**2
+            tip_index = tip_indexes[np.argmin(tip_distances)]
+            tip = (x_coords[tip_index], y_coords[tip_index])
         else:
             tip = (cx, max_width_y)
         
         vector = (tip[0] - cx, tip[1] - cy)
         
         # Calculate confidence
-        other_widths = [w for y, w in widths.items() if y != max_width_y]
-        if other_widths:
-            avg_other_width = np.mean(other_widths)
+        present_widths = widths[widths >= 0]
+        if len(present_widths) > 1:
+            avg_other_width = (np.sum(present_widths) - max_width) / (len(present_widths) - 1)
             confidence = max_width / avg_other_width if avg_other_width > 0 else 1.0
         else:
             confidence = 1.0
@@ -503,8 +515,8 @@ class PNGLayoutAnalyzer:
             Tuple of (layout_x, layout_y) in nanometers
         """
         # Simple conversion - may need adjustment based on actual layout scaling
-        layout_x = layout_origin[0] + (image_x - self.img.size[0] // 2)
-        layout_y = layout_origin[1] + (image_y - self.img.size[1] // 2)
+        layout_x = layout_origin[0] + (image_x - self._center[0])
+        layout_y = layout_origin[1] + (image_y - self._center[1])
         
         return layout_x, layout_y
     
@@ -30,6 +30,9 @@ from SiEPIC.utils import get_technology_by_name
 from SiEPIC.extend import to_itype
 from pya import Trans, CellInstArray, Text
 
+# Rotation names used in the test positions
+ROT_MAP = {'R0': Trans.R0, 'R90': Trans.R90, 'R180': Trans.R180, 'R270': Trans.R270}
+
 def create_test_layout():
     """Create a test layout with grating couplers in all four rotations."""
     
@@ -64,14 +67,7 @@ def create_test_layout():
     
     for i, (x, y, rotation, expected) in enumerate(positions):
         # Create transformation
-        if rotation == "R0":
-            t = Trans(Trans.R0, x, y)
-        elif rotation == "R90":
-            t = Trans(Trans.R90, x, y)
-        elif rotation == "R180":
-            t = Trans(Trans.R180, x, y)
-        elif rotation == "R270":
-            t = Trans(Trans.R270, x, y)
+        t = Trans(ROT_MAP[rotation], x, y)
         
         # Place grating coupler
         instGC = top_cell.insert(CellInstArray(cell_ebeam_gc.cell_index(), t))